@@ -1,8 +1,27 @@
 """ECB Exchange Rate Tools."""
 
-from .cli import cli
-from .store import ExchangeRateStore
+from typing import TYPE_CHECKING, Any
+
+from .constants import VERSION
+
+if TYPE_CHECKING:
+    from .cli import cli
+    from .store import ExchangeRateStore
 
 __all__ = ["ExchangeRateStore", "cli"]
 
-__version__ = "0.1.0"
+__version__ = VERSION
+
+
+def __getattr__(name: str) -> Any:
+    """Import the CLI and store lazily so importing ecbx stays cheap."""
+    if name == "cli":
+        from .cli import cli  # noqa: PLC0415
+
+        return cli
+    if name == "ExchangeRateStore":
+        from .store import ExchangeRateStore  # noqa: PLC0415
+
+        return ExchangeRateStore
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
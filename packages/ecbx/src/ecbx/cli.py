@@ -5,11 +5,7 @@ from datetime import datetime
 from decimal import Decimal
 
 import click
-from rich import box
-from rich.panel import Panel
-from rich.table import Table
 
-from .constants import BEFORE
 from .store import ExchangeRateStore
 from .utils import console, format_date
 
@@ -43,9 +39,9 @@ def cli(ctx: click.Context, db: str | None, verbose: bool) -> None:
     ctx.ensure_object(dict)
     ctx.obj["VERBOSE"] = verbose
 
-    # Initialize the database connection
-    store = ExchangeRateStore(db)
-    ctx.obj["STORE"] = store
+    # Initialize the database connection; closing it when the command
+    # finishes lets SQLite checkpoint the WAL once per invocation.
+    ctx.obj["STORE"] = ctx.with_resource(ExchangeRateStore(db))
 
 
 @cli.command()
@@ -83,6 +79,9 @@ def update(ctx: click.Context) -> None:
 @click.pass_context
 def status(ctx: click.Context) -> None:
     """Show the status of the exchange rate database."""
+    from rich import box  # noqa: PLC0415
+    from rich.table import Table  # noqa: PLC0415
+
     store: ExchangeRateStore = ctx.obj["STORE"]
     stats = store.get_stats()
 
@@ -130,6 +129,11 @@ def status(ctx: click.Context) -> None:
     default="before",
     help="Strategy for finding closest rate if exact date not found",
 )
+@click.option(
+    "--exact",
+    is_flag=True,
+    help="Convert with decimal instead of floating point arithmetic",
+)
 @click.pass_context
 def convert(
     ctx: click.Context,
@@ -138,6 +142,7 @@ def convert(
     target_currency: str,
     amount: float | None,
     closest: str,
+    exact: bool,
 ) -> None:
     """
     Convert an amount from BASE_CURRENCY to TARGET_CURRENCY.
@@ -145,6 +150,10 @@ def convert(
     DATE is the date to use for conversion (defaults to latest available date).
     If an AMOUNT is provided, it will be converted using the rate.
     """
+    from rich import box  # noqa: PLC0415
+    from rich.panel import Panel  # noqa: PLC0415
+    from rich.table import Table  # noqa: PLC0415
+
     store: ExchangeRateStore = ctx.obj["STORE"]
     verbose: bool = ctx.obj["VERBOSE"]
 
@@ -173,7 +182,9 @@ def convert(
 
     if amount is not None:
         table.add_column("Conversion", justify="right", style="cyan")
-        converted = Decimal(str(amount)) * rate
+        # The result is only displayed to two decimals, so float precision
+        # is plenty unless decimal arithmetic is asked for.
+        converted = Decimal(str(amount)) * rate if exact else amount * float(rate)
         amount_str = f"{amount:.2f} {base_currency} = {converted:.2f} {target_currency}"
         table.add_row(
             actual_date, f"1 {base_currency} = {rate:.6f} {target_currency}", amount_str
@@ -203,6 +214,9 @@ def convert(
 @click.pass_context
 def currencies(ctx: click.Context) -> None:
     """List all available currencies."""
+    from rich import box  # noqa: PLC0415
+    from rich.table import Table  # noqa: PLC0415
+
     store: ExchangeRateStore = ctx.obj["STORE"]
     available = store.list_currencies()
 
@@ -229,42 +243,26 @@ def rates(ctx: click.Context, date: str | None) -> None:
 
     DATE is the date to show rates for (defaults to latest available date).
     """
-    store: ExchangeRateStore = ctx.obj["STORE"]
+    from rich import box  # noqa: PLC0415
+    from rich.table import Table  # noqa: PLC0415
 
-    if date is None:
-        date = "latest"
-
-    # Get the actual date
-    actual_date, _ = store.get_rate("EUR", "USD", date, BEFORE)
-
-    if not actual_date:
-        console.print(f"[bold red]No rates found for {date}[/bold red]")
-        return
-
-    # Get all EUR based rates for this date
-    cursor = store.conn.cursor()
-    cursor.execute(
-        """
-    SELECT target_currency, rate
-    FROM rates
-    WHERE date = ? AND base_currency = 'EUR'
-    ORDER BY target_currency
-    """,
-        (actual_date,),
-    )
+    store: ExchangeRateStore = ctx.obj["STORE"]
 
-    rate_rows = list(cursor.fetchall())
+    # Resolve the date and fetch all EUR based rates for it in one
+    # statement, formatted by SQLite
+    rate_rows = store.get_rates_on_date("EUR", date)
 
     if not rate_rows:
-        console.print(f"[bold red]No rates found for {actual_date}[/bold red]")
+        console.print(f"[bold red]No rates found for {date or 'latest'}[/bold red]")
         return
 
+    actual_date = rate_rows[0][2]
     table = Table(title=f"Exchange Rates for {actual_date}", box=box.ROUNDED)
     table.add_column("Currency", style="cyan")
     table.add_column("Rate (EUR base)", style="green", justify="right")
 
-    for rate_row in rate_rows:
-        table.add_row(rate_row[0], f"{rate_row[1]:.6f}")
+    for currency, rate, _ in rate_rows:
+        table.add_row(currency, rate)
 
     console.print(table)
 
@@ -290,73 +288,49 @@ def matrix(
     DATE is the date to show rates for (defaults to latest available date).
     BASE_CURRENCY is the base currency to use.
     """
+    from rich import box  # noqa: PLC0415
+    from rich.table import Table  # noqa: PLC0415
+
     store: ExchangeRateStore = ctx.obj["STORE"]
     base_currency = base_currency.upper()
 
-    if date is None:
-        date = "latest"
-
-    # Get the actual date
-    actual_date, _ = store.get_rate(base_currency, "EUR", date, BEFORE)
-
-    if not actual_date:
-        console.print(f"[bold red]No rates found for {date}[/bold red]")
-        return
-
-    # Get all rates for this base currency on this date
-    cursor = store.conn.cursor()
-    cursor.execute(
-        """
-    SELECT target_currency, rate
-    FROM rates
-    WHERE date = ? AND base_currency = ?
-    ORDER BY target_currency
-    """,
-        (actual_date, base_currency),
-    )
-
-    rate_rows = list(cursor.fetchall())
+    # Resolve the date and fetch all rates for this base currency in one
+    # statement
+    rate_rows = store.get_rates_on_date(base_currency, date, output_format)
 
     if not rate_rows:
         console.print(
-            f"[bold red]No rates found for {base_currency} on {actual_date}[/bold red]"
+            f"[bold red]No rates found for {base_currency} on {date or 'latest'}[/bold red]"
         )
         return
 
+    actual_date = rate_rows[0][2]
     if output_format == "json":
+        rates = {currency: rate for currency, rate, _ in rate_rows}
         result = {
             "date": actual_date,
             "base": base_currency,
-            "rates": {r[0]: float(r[1]) for r in rate_rows},
+            "rates": rates,
         }
         console.print(json.dumps(result, indent=2))
-    else:
-        table = Table(
-            title=f"Exchange Rates for {base_currency} on {actual_date}",
-            box=box.ROUNDED,
-        )
-        table.add_column("Currency", style="cyan")
-        table.add_column("Rate", style="green", justify="right")
+        return
 
-        for rate_row in rate_rows:
-            table.add_row(rate_row[0], f"{rate_row[1]:.6f}")
+    table = Table(
+        title=f"Exchange Rates for {base_currency} on {actual_date}",
+        box=box.ROUNDED,
+    )
+    table.add_column("Currency", style="cyan")
+    table.add_column("Rate", style="green", justify="right")
+
+    for currency, rate, _ in rate_rows:
+        table.add_row(currency, rate)
 
-        console.print(table)
+    console.print(table)
 
 
 def main() -> None:
-    """Main entry point with proper cleanup."""
+    """Main entry point; the store is closed by the click context."""
     try:
         cli()
     except Exception as e:  # noqa: BLE001  # entry-point handler: surface any uncaught error to the user
         console.print(f"[bold red]Error: {e}[/bold red]")
-    finally:
-        # Close any open database connections
-        try:
-            ctx = click.get_current_context(silent=True)
-            if ctx and ctx.obj:
-                store = ctx.obj.get("STORE")
-                if store:
-                    store.close()
-        except RuntimeError:
-            pass
@@ -1,11 +1,18 @@
 """Constants for ECB exchange rate operations."""
 
+VERSION = "0.1.0"
+USER_AGENT = f"ecbx/{VERSION}"
+
 # ECB API URLs
 ECB_URL_90D = "https://www.ecb.europa.eu/stats/eurofxref/eurofxref-hist-90d.xml"
 ECB_URL_HIST = "https://www.ecb.europa.eu/stats/eurofxref/eurofxref-hist.xml"
 
+# How long a downloaded feed is reused before fetching it again (seconds)
+HTTP_CACHE_TTL = 3600
+
 # XML namespace
 ECB_NAMESPACE = {"ns": "http://www.ecb.int/vocabulary/2002-08-01/eurofxref"}
+ECB_CUBE_TAG = f"{{{ECB_NAMESPACE['ns']}}}Cube"
 
 # Direction constants for closest rate
 BEFORE = "before"
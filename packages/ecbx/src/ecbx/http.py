@@ -0,0 +1,121 @@
+"""Shared HTTP session and response cache for ECB requests."""
+
+import hashlib
+import json
+import os
+import time
+from http import HTTPStatus
+from io import BytesIO
+from pathlib import Path
+from typing import IO
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from .constants import HTTP_CACHE_TTL, USER_AGENT
+
+# Bytes written to the cache per read while downloading a feed
+CHUNK_SIZE = 64 * 1024
+
+# Response headers kept with a cached feed to revalidate it once it expires
+_VALIDATOR_HEADERS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+
+# A single session keeps the TCP/TLS connection to the ECB alive across
+# fetches instead of paying a new handshake for every request.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=4,
+        max_retries=Retry(total=3, backoff_factor=0.5),
+    ),
+)
+SESSION.headers.update(
+    {
+        "User-Agent": USER_AGENT,
+        "Accept-Encoding": "gzip, deflate",
+    }
+)
+
+
+def get_cache_dir() -> Path:
+    """Get the HTTP cache directory using XDG standard."""
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    cache_base = Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+
+    cache_dir = cache_base / "ecbx" / "http"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    return cache_dir
+
+
+def cached_get(url: str, timeout: float) -> IO[bytes]:
+    """
+    Fetch a URL, reusing the copy on disk if it is younger than the TTL.
+
+    The ECB publishes new rates once per business day, so repeated runs
+    within the TTL are served from the cache without touching the network.
+    An expired copy is revalidated with a conditional request and reused
+    when the server answers 304 Not Modified. If the cache cannot be read or
+    written, the URL is fetched again without it.
+    """
+    try:
+        return _cached_get(url, timeout)
+    except requests.RequestException:
+        raise
+    except OSError:
+        response = SESSION.get(url, timeout=timeout)
+        response.raise_for_status()
+        return BytesIO(response.content)
+
+
+def _cached_get(url: str, timeout: float) -> IO[bytes]:
+    cache_file = get_cache_dir() / hashlib.sha256(url.encode()).hexdigest()
+    validators_file = cache_file.with_suffix(".headers")
+    headers: dict[str, str] = {}
+    try:
+        if time.time() - cache_file.stat().st_mtime < HTTP_CACHE_TTL:
+            return cache_file.open("rb")
+        validators = json.loads(validators_file.read_text())
+        headers = {
+            _VALIDATOR_HEADERS[name]: value
+            for name, value in validators.items()
+            if name in _VALIDATOR_HEADERS
+        }
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
+
+    response = SESSION.get(url, timeout=timeout, stream=True, headers=headers)
+    if response.status_code == HTTPStatus.NOT_MODIFIED:
+        response.close()
+        cache_file.touch()
+        return cache_file.open("rb")
+    response.raise_for_status()
+
+    # Write to a temporary file first so a failed download never leaves a
+    # truncated feed behind in the cache. iter_content decodes the body and
+    # raises read failures as requests exceptions.
+    partial_file = cache_file.with_suffix(".part")
+    try:
+        with partial_file.open("wb") as f:
+            for chunk in response.iter_content(CHUNK_SIZE):
+                f.write(chunk)
+    except requests.RequestException:
+        partial_file.unlink(missing_ok=True)
+        raise
+    finally:
+        response.close()
+    partial_file.replace(cache_file)
+    validators_file.write_text(
+        json.dumps(
+            {
+                name: response.headers[name]
+                for name in _VALIDATOR_HEADERS
+                if name in response.headers
+            }
+        )
+    )
+
+    return cache_file.open("rb")
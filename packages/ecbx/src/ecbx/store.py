@@ -1,14 +1,220 @@
 """Exchange rate storage and retrieval."""
 
+import contextlib
+import functools
 import os
+import queue
 import sqlite3
-from datetime import date
+import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from datetime import UTC, date, datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Self
+
+from .constants import AFTER, BEFORE, CLOSEST, ECB_URL_90D, ECB_URL_HIST
+from .utils import console, fetch_ecb_data, get_last_business_day, iter_ecb_rates
+
+_IN_MEMORY_DB = ":memory:"
+
+# Applied to every connection: the larger page cache keeps the hot rate
+# pages in memory.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA busy_timeout = 5000",
+)
+
+# Only meaningful for on-disk databases: WAL keeps readers unblocked while
+# `update` writes, NORMAL sync only fsyncs at checkpoints and the mmap
+# window avoids read syscalls.
+_FILE_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA mmap_size = 268435456",
+)
+
+# Read-only connections cannot change the journal mode or sync setting, the
+# database is already in WAL mode by the time they are opened.
+_READER_PRAGMAS = (*_CONNECTION_PRAGMAS, "PRAGMA mmap_size = 268435456")
+
+# Rates for a currency pair are derived from the EUR reference rates in a
+# single statement: EUR->X is stored directly, X->EUR is its inverse and
+# X->Y joins the two EUR rates published on the same day.
+_PAIR_RATES_SQL = {
+    "direct": """
+    SELECT date, rate FROM rates
+    WHERE base_currency = 'EUR' AND target_currency = :target
+    """,
+    "inverse": """
+    SELECT date, 1.0 / rate AS rate FROM rates
+    WHERE base_currency = 'EUR' AND target_currency = :base
+    """,
+    "cross": """
+    SELECT t.date AS date, t.rate / b.rate AS rate
+    FROM rates AS b
+    JOIN rates AS t ON t.date = b.date AND t.base_currency = 'EUR'
+    WHERE b.base_currency = 'EUR' AND b.target_currency = :base
+        AND t.target_currency = :target
+    """,
+}
+
+# Statements kept as constants so every call reuses the same cached
+# prepared statement
+_TABLES_EXIST_SQL = "SELECT name FROM sqlite_master WHERE type='table' AND name='rates'"
+_LAST_UPDATED_SQL = "SELECT value FROM metadata WHERE key = 'last_updated'"
+_INSERT_CURRENCY_SQL = "INSERT OR IGNORE INTO currencies (code) VALUES (?)"
+_INSERT_RATE_SQL = """
+INSERT OR REPLACE INTO rates (date, base_currency, target_currency, rate)
+VALUES (?, ?, ?, ?)
+"""
+_SET_LAST_UPDATED_SQL = """
+INSERT OR REPLACE INTO metadata (key, value) VALUES ('last_updated', ?)
+"""
+
+# All statistics in one statement instead of a round-trip per figure
+_STATS_SQL = """
+SELECT
+    (SELECT value FROM metadata WHERE key = 'last_updated'),
+    (SELECT COUNT(DISTINCT code) FROM currencies),
+    (SELECT COUNT(*) FROM rates),
+    (SELECT MIN(date) FROM rates),
+    (SELECT MAX(date) FROM rates)
+"""
+
+# Lookups for one currency pair walk its dates in order, which the
+# date-first primary key cannot serve
+_CREATE_PAIR_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS idx_rates_pair_date
+ON rates (base_currency, target_currency, date)
+"""
+
+# Rows with any base but EUR, written as two index range scans on the pair
+# index since `!=` cannot use it
+_DELETE_DERIVED_RATES_SQL = """
+DELETE FROM rates WHERE base_currency < 'EUR' OR base_currency > 'EUR'
+"""
+
+_EXACT = "exact"
+
+# One (date, base_currency, target_currency, rate) row of the rates table
+RateRow = tuple[str, str, str, float]
+
+# The requested date, or the last update date when :date is NULL ('latest'),
+# so resolving 'latest' does not need a separate metadata query
+_REQUESTED_DATE = (
+    "COALESCE(:date, (SELECT value FROM metadata WHERE key = 'last_updated'))"
+)
+
+# Lookup strategies applied on top of the derived pair rates
+_RATE_LOOKUP_SQL = {
+    _EXACT: "SELECT date, rate FROM ({pair}) WHERE date = {date}",
+    BEFORE: """
+    SELECT date, rate FROM ({pair})
+    WHERE date <= {date} ORDER BY date DESC LIMIT 1
+    """,
+    AFTER: """
+    SELECT date, rate FROM ({pair})
+    WHERE date >= {date} ORDER BY date ASC LIMIT 1
+    """,
+    # The nearest rate is one of the two neighbours of the date, so only
+    # those two rows (each an index seek) are compared instead of scanning
+    # every rate of the pair.
+    CLOSEST: """
+    SELECT date, rate FROM (
+        SELECT * FROM (
+            SELECT date, rate FROM ({pair})
+            WHERE date <= {date} ORDER BY date DESC LIMIT 1
+        )
+        UNION ALL
+        SELECT * FROM (
+            SELECT date, rate FROM ({pair})
+            WHERE date >= {date} ORDER BY date ASC LIMIT 1
+        )
+    )
+    ORDER BY ABS(julianday(date) - julianday({date})) LIMIT 1
+    """,
+}
+
+_RATE_QUERIES = {
+    (strategy, kind): lookup.format(pair=pair, date=_REQUESTED_DATE)
+    for strategy, lookup in _RATE_LOOKUP_SQL.items()
+    for kind, pair in _PAIR_RATES_SQL.items()
+}
+
+# All rates for a base currency on the given date, or on the latest date
+# before it when there is no publication that day (the latest date overall
+# when no date is given). Only EUR reference rates are stored, so the rates
+# for any other base are derived by dividing by that day's EUR->base rate.
+_RATES_ON_DATE_SQL = """
+    WITH day AS (
+        SELECT MAX(date) AS date
+        FROM rates
+        WHERE base_currency = 'EUR'
+          AND (:base = 'EUR' OR target_currency = :base)
+          AND (:date IS NULL OR date <= :date)
+    ),
+    eur_rates AS (
+        SELECT target_currency, rate
+        FROM rates
+        WHERE base_currency = 'EUR' AND date = (SELECT date FROM day)
+        UNION ALL
+        SELECT 'EUR', 1.0
+    ),
+    base_rates AS (
+        SELECT t.target_currency, t.rate / b.rate AS rate
+        FROM eur_rates AS t, eur_rates AS b
+        WHERE b.target_currency = :base AND t.target_currency != :base
+    )
+    SELECT target_currency, {rate_column}, (SELECT date FROM day)
+    FROM base_rates
+    ORDER BY target_currency
+"""
+
+# Text output is formatted by SQLite, JSON output needs the numeric value.
+# Both variants are built once so every call reuses the same statement.
+_RATES_ON_DATE_QUERIES = {
+    "text": _RATES_ON_DATE_SQL.format(rate_column="printf('%.6f', rate)"),
+    "json": _RATES_ON_DATE_SQL.format(rate_column="rate"),
+}
+
+
+def _pair_kind(base_currency: str, target_currency: str) -> str:
+    """Classify how the rate for a currency pair is derived from EUR rates."""
+    if base_currency == "EUR":
+        return "direct"
+    if target_currency == "EUR":
+        return "inverse"
+    return "cross"
+
+
+def _read_rate_rows(
+    xml_data: IO[bytes] | bytes, after: str | None = None
+) -> list[RateRow] | None:
+    """
+    Stream the EUR reference rates published after the given date into rows.
 
-from .constants import AFTER, BEFORE, CLOSEST, ECB_NAMESPACE, ECB_URL_90D, ECB_URL_HIST
-from .utils import console, fetch_ecb_data, parse_ecb_xml
+    Rows are built straight from the parser without an intermediate mapping
+    and sorted into primary key order: the feed lists the newest day first,
+    inserting in key order appends to the clustered rates b-tree instead of
+    splitting pages all over it.
+    """
+    rate_rows: list[RateRow] = []
+    try:
+        # Closing the generator on an early break also closes the feed
+        with contextlib.closing(iter_ecb_rates(xml_data)) as rates:
+            for date_str, currency, rate_str in rates:
+                # The feed is ordered newest first, so the first known date
+                # ends the new data and the rest of the feed is not parsed
+                if after is not None and date_str <= after:
+                    break
+                rate_rows.append((date_str, "EUR", currency, float(rate_str)))
+    except ET.ParseError as e:
+        console.print(f"[bold red]Error parsing XML: {e}[/bold red]")
+        return None
+    rate_rows.sort()
+    return rate_rows
 
 
 def get_db_path() -> Path:
@@ -38,30 +244,122 @@ class ExchangeRateStore:
             self.db_path = get_db_path()
         else:
             self.db_path = Path(db_path)
-
-        self._initialize_connection()
-
-    def _initialize_connection(self) -> None:
+        self._in_memory = db_path == _IN_MEMORY_DB
+
+        # Read queries are memoized per store; the caches are dropped when
+        # this store writes (invalidate) or another connection commits
+        # (PRAGMA data_version changes).
+        self._data_version: int | None = None
+        self._tables_exist = False
+        self._cached_rate = functools.lru_cache(maxsize=1024)(self._lookup_rate)
+        self._cached_currencies = functools.lru_cache(maxsize=1)(self._read_currencies)
+        self._cached_stats = functools.lru_cache(maxsize=1)(self._read_stats)
+
+        # The connection is opened on first use, so commands that never
+        # touch the database skip the connect and PRAGMA setup.
+        self._conn: sqlite3.Connection | None = None
+
+        # Read queries run on a pool of read-only connections, opened on
+        # demand, so lookups from several threads proceed concurrently under
+        # WAL instead of serializing on the read-write connection.
+        self._readers: queue.Queue[sqlite3.Connection] = queue.Queue()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The database connection, opened on first access."""
+        if self._conn is None:
+            self._conn = self._initialize_connection()
+        return self._conn
+
+    def _initialize_connection(self) -> sqlite3.Connection:
         """Initialize the database connection."""
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.execute("PRAGMA foreign_keys = ON")
-        # Set up proper decimal handling
-        sqlite3.register_adapter(Decimal, str)
-        sqlite3.register_converter("DECIMAL", lambda s: Decimal(s.decode("utf-8")))
-        self.conn.row_factory = sqlite3.Row
+        # A larger statement cache keeps every prepared lookup query alive
+        # for the lifetime of the connection. Writes open their transaction
+        # explicitly with BEGIN IMMEDIATE instead of relying on implicit
+        # transactions.
+        conn = sqlite3.connect(
+            self.db_path, cached_statements=256, isolation_level=None
+        )
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        if not self._in_memory:
+            for pragma in _FILE_PRAGMAS:
+                conn.execute(pragma)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection for the reader pool."""
+        conn = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            cached_statements=256,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        for pragma in _READER_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextlib.contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection from the pool."""
+        # Other connections cannot see a private in-memory database
+        if self._in_memory:
+            yield self.conn
+            return
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            conn = self._open_reader()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
 
     def _check_tables_exist(self) -> bool:
         """Check if the necessary tables exist in the database."""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='rates'"
-        )
-        return cursor.fetchone() is not None
+        # A missing database file cannot hold the tables; don't create it
+        # just to find out
+        if self._conn is None and not self._in_memory and not self.db_path.exists():
+            return False
+        # Tables are never dropped, so once found the answer is remembered
+        if not self._tables_exist:
+            row = self.conn.execute(_TABLES_EXIST_SQL).fetchone()
+            self._tables_exist = row is not None
+        return self._tables_exist
+
+    def invalidate(self) -> None:
+        """Drop all memoized query results."""
+        self._cached_rate.cache_clear()
+        self._cached_currencies.cache_clear()
+        self._cached_stats.cache_clear()
+
+    def _sync_caches(self) -> None:
+        """Invalidate the caches if another connection changed the database."""
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self._data_version:
+            self._data_version = data_version
+            self.invalidate()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def close(self) -> None:
-        """Close the database connection."""
-        if hasattr(self, "conn") and self.conn:
-            self.conn.close()
+        """Close the database connections."""
+        # Readers go first so closing the read-write connection last can
+        # checkpoint and remove the WAL
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
     def initialize(self) -> tuple[int, int]:
         """
@@ -72,107 +370,73 @@ class ExchangeRateStore:
         """
         cursor = self.conn.cursor()
 
-        # Create tables if they don't exist
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS currencies (
-            code TEXT PRIMARY KEY,
-            name TEXT
-        )
-        """)
-
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS rates (
-            date TEXT,
-            base_currency TEXT,
-            target_currency TEXT,
-            rate DECIMAL(20, 10) NOT NULL,
-            PRIMARY KEY (date, base_currency, target_currency)
-        )
-        """)
+        # Create the schema in a single transaction
+        with self.conn:
+            cursor.execute("BEGIN IMMEDIATE")
 
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS metadata (
-            key TEXT PRIMARY KEY,
-            value TEXT
-        )
-        """)
+            # Create tables if they don't exist
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS currencies (
+                code TEXT PRIMARY KEY,
+                name TEXT
+            )
+            """)
+
+            # WITHOUT ROWID clusters rows by the primary key, so lookups by
+            # (date, base_currency) read the rate straight from the key b-tree.
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS rates (
+                date TEXT NOT NULL,
+                base_currency TEXT NOT NULL,
+                target_currency TEXT NOT NULL,
+                rate REAL NOT NULL,
+                PRIMARY KEY (date, base_currency, target_currency)
+            ) WITHOUT ROWID
+            """)
+
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS metadata (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+            """)
 
-        # Insert EUR as base currency
-        cursor.execute(
-            "INSERT OR IGNORE INTO currencies (code, name) VALUES (?, ?)",
-            ("EUR", "Euro"),
-        )
+            # Insert EUR as base currency
+            cursor.execute(
+                "INSERT OR IGNORE INTO currencies (code, name) VALUES (?, ?)",
+                ("EUR", "Euro"),
+            )
+
+        self._tables_exist = True
 
         # Fetch and parse historical data
         xml_data = fetch_ecb_data(ECB_URL_HIST)
         if xml_data is None:
             return (0, 0)
 
-        root = parse_ecb_xml(xml_data)
-        if root is None:
+        rate_rows = _read_rate_rows(xml_data)
+        if rate_rows is None:
             return (0, 0)
 
-        # Process all dates and rates
-        rate_count = 0
-        dates: set[str] = set()
-
-        for date_node in root.findall(".//ns:Cube[@time]", ECB_NAMESPACE):
-            date_str = date_node.attrib.get("time")
-            if date_str is None:
-                continue
-            dates.add(date_str)
-
-            # Insert rates for this date
-            for currency_node in date_node.findall(
-                ".//ns:Cube[@currency]", ECB_NAMESPACE
-            ):
-                currency = currency_node.attrib.get("currency")
-                rate_str = currency_node.attrib.get("rate")
-                if currency is None or rate_str is None:
-                    continue
-                rate = Decimal(rate_str)
-
-                # EUR to target currency
-                cursor.execute(
-                    """
-                INSERT OR REPLACE INTO rates (date, base_currency, target_currency, rate)
-                VALUES (?, ?, ?, ?)
-                """,
-                    (date_str, "EUR", currency, rate),
-                )
-
-                # Target currency to EUR (inverse rate)
-                cursor.execute(
-                    """
-                INSERT OR REPLACE INTO rates (date, base_currency, target_currency, rate)
-                VALUES (?, ?, ?, ?)
-                """,
-                    (date_str, currency, "EUR", Decimal(1) / rate),
-                )
-
-                # Add the currency to the currencies table
-                cursor.execute(
-                    "INSERT OR IGNORE INTO currencies (code) VALUES (?)", (currency,)
-                )
-
-                rate_count += 2  # Counting both directions
-
-        # Store the latest update date
-        if dates:
-            latest_date = max(dates)
-            cursor.execute(
-                """
-            INSERT OR REPLACE INTO metadata (key, value)
-            VALUES ('last_updated', ?)
-            """,
-                (latest_date,),
-            )
+        dates = {row[0] for row in rate_rows}
+        currencies = {row[2] for row in rate_rows}
 
-            # Calculate cross-rates for all dates
-            for date_str in dates:
-                rate_count += self._calculate_cross_rates(date_str)
+        with self.conn:
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.executemany(_INSERT_CURRENCY_SQL, [(code,) for code in currencies])
+            cursor.executemany(_INSERT_RATE_SQL, rate_rows)
+            rate_count = len(rate_rows)
 
-        self.conn.commit()
+            # The pair index is built once after the bulk load rather than
+            # maintained row by row.
+            cursor.execute(_CREATE_PAIR_INDEX_SQL)
+
+            # Store the latest update date
+            if dates:
+                latest_date = max(dates)
+                cursor.execute(_SET_LAST_UPDATED_SQL, (latest_date,))
+
+        self.invalidate()
         return (rate_count, len(dates))
 
     def get_last_update_date(self) -> str | None:
@@ -185,9 +449,7 @@ class ExchangeRateStore:
         if not self._check_tables_exist():
             return None
 
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT value FROM metadata WHERE key = 'last_updated'")
-        row = cursor.fetchone()
+        row = self.conn.execute(_LAST_UPDATED_SQL).fetchone()
 
         if row:
             return str(row[0])
@@ -207,208 +469,65 @@ class ExchangeRateStore:
             rates, _ = self.initialize()
             return (rates, self.get_last_update_date())
 
+        # Get the last update date; nothing newer can be published before
+        # the next business day
+        last_update = self.get_last_update_date()
+        today = get_last_business_day(datetime.now(tz=UTC))
+        if last_update == today.strftime("%Y-%m-%d"):
+            return (0, None)
+
         # Fetch the latest data
         xml_data = fetch_ecb_data(ECB_URL_90D)
         if xml_data is None:
             return (0, None)
 
-        root = parse_ecb_xml(xml_data)
-        if root is None:
+        # Skip the dates we already have
+        rate_rows = _read_rate_rows(xml_data, after=last_update)
+        if rate_rows is None:
             return (0, None)
 
-        # Get the last update date
-        last_update = self.get_last_update_date()
-
-        cursor = self.conn.cursor()
-        rate_count = 0
-        latest_date: str | None = None
-
-        for date_node in root.findall(".//ns:Cube[@time]", ECB_NAMESPACE):
-            date_str = date_node.attrib.get("time")
-            if date_str is None:
-                continue
-
-            # Skip if we already have this date
-            if last_update and date_str <= last_update:
-                continue
-
-            if latest_date is None or date_str > latest_date:
-                latest_date = date_str
-
-            # Insert rates for this date
-            for currency_node in date_node.findall(
-                ".//ns:Cube[@currency]", ECB_NAMESPACE
-            ):
-                currency = currency_node.attrib.get("currency")
-                rate_str = currency_node.attrib.get("rate")
-                if currency is None or rate_str is None:
-                    continue
-                rate = Decimal(rate_str)
-
-                # EUR to target currency
-                cursor.execute(
-                    """
-                INSERT OR REPLACE INTO rates (date, base_currency, target_currency, rate)
-                VALUES (?, ?, ?, ?)
-                """,
-                    (date_str, "EUR", currency, rate),
-                )
-
-                # Target currency to EUR (inverse rate)
-                cursor.execute(
-                    """
-                INSERT OR REPLACE INTO rates (date, base_currency, target_currency, rate)
-                VALUES (?, ?, ?, ?)
-                """,
-                    (date_str, currency, "EUR", Decimal(1) / rate),
-                )
-
-                # Add the currency to the currencies table
-                cursor.execute(
-                    "INSERT OR IGNORE INTO currencies (code) VALUES (?)", (currency,)
-                )
-
-                rate_count += 2  # Counting both directions
-
-        # Calculate all cross-rates for this date
-        if latest_date:
-            rate_count += self._calculate_cross_rates(latest_date)
-
-            # Update the latest update date
-            cursor.execute(
-                """
-            INSERT OR REPLACE INTO metadata (key, value)
-            VALUES ('last_updated', ?)
-            """,
-                (latest_date,),
-            )
-
-        self.conn.commit()
-        return (rate_count, latest_date)
-
-    def _calculate_cross_rates(self, date_str: str) -> int:
-        """
-        Calculate cross-rates between all currency pairs.
-
-        Args:
-            date_str: The date to calculate cross-rates for.
-
-        Returns:
-            Number of cross-rates calculated.
-        """
         cursor = self.conn.cursor()
+        latest_date = rate_rows[-1][0] if rate_rows else None
+        currencies = {row[2] for row in rate_rows}
 
-        # Get all currencies that have rates against EUR for this date
-        cursor.execute(
-            """
-        SELECT DISTINCT target_currency
-        FROM rates
-        WHERE date = ? AND base_currency = 'EUR'
-        """,
-            (date_str,),
-        )
-
-        currencies = [row[0] for row in cursor.fetchall()]
-        count = 0
-
-        # Calculate cross-rates for all currency pairs
-        for base in currencies:
-            if base == "EUR":
-                continue
-
-            # Get the rate from base to EUR
-            cursor.execute(
-                """
-            SELECT rate
-            FROM rates
-            WHERE date = ? AND base_currency = ? AND target_currency = 'EUR'
-            """,
-                (date_str, base),
-            )
-
-            base_to_eur_row = cursor.fetchone()
-            if not base_to_eur_row:
-                continue
+        with self.conn:
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.executemany(_INSERT_CURRENCY_SQL, [(code,) for code in currencies])
+            cursor.executemany(_INSERT_RATE_SQL, rate_rows)
+            rate_count = len(rate_rows)
 
-            base_to_eur_rate = Decimal(str(base_to_eur_row[0]))
-
-            for target in currencies:
-                if target in {"EUR", base}:
-                    continue
-
-                # Get the rate from EUR to target
-                cursor.execute(
-                    """
-                SELECT rate
-                FROM rates
-                WHERE date = ? AND base_currency = 'EUR' AND target_currency = ?
-                """,
-                    (date_str, target),
-                )
-
-                eur_to_target_row = cursor.fetchone()
-                if not eur_to_target_row:
-                    continue
-
-                eur_to_target_rate = Decimal(str(eur_to_target_row[0]))
-
-                # Calculate the cross-rate
-                cross_rate = eur_to_target_rate * base_to_eur_rate
+            # Update the latest update date
+            if latest_date:
+                cursor.execute(_SET_LAST_UPDATED_SQL, (latest_date,))
 
-                # Insert the cross-rate
-                cursor.execute(
-                    """
-                INSERT OR REPLACE INTO rates (date, base_currency, target_currency, rate)
-                VALUES (?, ?, ?, ?)
-                """,
-                    (date_str, base, target, cross_rate),
-                )
+            # Databases initialized before the pair index existed get it on
+            # their next update
+            cursor.execute(_CREATE_PAIR_INDEX_SQL)
 
-                count += 1
+            # Inverse and cross rates materialized by older versions are
+            # never read, drop them so the table only holds EUR rates
+            cursor.execute(_DELETE_DERIVED_RATES_SQL)
 
-        return count
+        self.invalidate()
+        return (rate_count, latest_date)
 
     def _query_closest_rate(
         self,
-        cursor: sqlite3.Cursor,
-        date_str: str,
+        date_str: str | None,
         base_currency: str,
         target_currency: str,
         strategy: str,
     ) -> tuple[str | None, Decimal | None]:
         """Execute a nearest-rate SQL query for the given strategy."""
-        if strategy == BEFORE:
-            cursor.execute(
-                """
-            SELECT date, rate FROM rates
-            WHERE date <= ? AND base_currency = ? AND target_currency = ?
-            ORDER BY date DESC LIMIT 1
-            """,
-                (date_str, base_currency, target_currency),
-            )
-        elif strategy == AFTER:
-            cursor.execute(
-                """
-            SELECT date, rate FROM rates
-            WHERE date >= ? AND base_currency = ? AND target_currency = ?
-            ORDER BY date ASC LIMIT 1
-            """,
-                (date_str, base_currency, target_currency),
-            )
-        elif strategy == CLOSEST:
-            cursor.execute(
-                """
-            SELECT date, rate, ABS(julianday(date) - julianday(?)) as diff
-            FROM rates
-            WHERE base_currency = ? AND target_currency = ?
-            ORDER BY diff ASC LIMIT 1
-            """,
-                (date_str, base_currency, target_currency),
-            )
-        else:
+        if strategy not in {BEFORE, AFTER, CLOSEST}:
             return (date_str, None)
 
-        row = cursor.fetchone()
+        sql = _RATE_QUERIES[strategy, _pair_kind(base_currency, target_currency)]
+        with self._reader() as conn:
+            row = conn.execute(
+                sql,
+                {"date": date_str, "base": base_currency, "target": target_currency},
+            ).fetchone()
         if row:
             return (str(row[0]), Decimal(str(row[1])))
         return (date_str, None)
@@ -439,35 +558,36 @@ class ExchangeRateStore:
             )
             return (None, None)
 
-        cursor = self.conn.cursor()
-
         # Normalize currency codes
         base_currency = base_currency.upper()
         target_currency = target_currency.upper()
 
-        # Resolve 'latest' to a concrete date string
+        # 'latest' is resolved to the last update date inside the queries
+        date_str: str | None
         if as_of_date == "latest":
-            cursor.execute("SELECT value FROM metadata WHERE key = 'last_updated'")
-            row = cursor.fetchone()
-            if not row:
-                return (None, None)
-            date_str = str(row[0])
+            date_str = None
         elif isinstance(as_of_date, date):
             date_str = as_of_date.strftime("%Y-%m-%d")
         else:
             date_str = as_of_date
 
-        # Try to get the rate for the exact date
-        cursor.execute(
-            """
-        SELECT date, rate
-        FROM rates
-        WHERE date = ? AND base_currency = ? AND target_currency = ?
-        """,
-            (date_str, base_currency, target_currency),
-        )
+        self._sync_caches()
+        return self._cached_rate(base_currency, target_currency, date_str, closest_rate)
 
-        row = cursor.fetchone()
+    def _lookup_rate(
+        self,
+        base_currency: str,
+        target_currency: str,
+        date_str: str | None,
+        closest_rate: str | None,
+    ) -> tuple[str | None, Decimal | None]:
+        """Look up a rate for a resolved date, falling back to the strategy."""
+        # Try to get the rate for the exact date
+        with self._reader() as conn:
+            row = conn.execute(
+                _RATE_QUERIES[_EXACT, _pair_kind(base_currency, target_currency)],
+                {"date": date_str, "base": base_currency, "target": target_currency},
+            ).fetchone()
         if row:
             return (str(row[0]), Decimal(str(row[1])))
 
@@ -475,9 +595,37 @@ class ExchangeRateStore:
             return (date_str, None)
 
         return self._query_closest_rate(
-            cursor, date_str, base_currency, target_currency, closest_rate
+            date_str, base_currency, target_currency, closest_rate
         )
 
+    def get_rates_on_date(
+        self, base_currency: str, as_of_date: str | None, output_format: str = "text"
+    ) -> list[tuple[str, Any, str]]:
+        """
+        Get all rates for a base currency on a date.
+
+        Args:
+            base_currency: The base currency code.
+            as_of_date: The date to get the rates for, or None for the latest.
+                        Falls back to the latest date before it.
+            output_format: 'text' for rates formatted by SQLite, 'json' for
+                           numeric rates.
+
+        Returns:
+            List of (currency, rate, date) tuples, empty if none were found.
+        """
+        if not self._check_tables_exist():
+            console.print(
+                "[yellow]Database not initialized. Run 'initialize' first.[/yellow]"
+            )
+            return []
+
+        with self._reader() as conn:
+            return conn.execute(
+                _RATES_ON_DATE_QUERIES[output_format],
+                {"base": base_currency.upper(), "date": as_of_date},
+            ).fetchall()
+
     def list_currencies(self) -> list[str]:
         """
         List all available currencies in the database.
@@ -488,9 +636,14 @@ class ExchangeRateStore:
         if not self._check_tables_exist():
             return []
 
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT DISTINCT code FROM currencies ORDER BY code")
-        return [str(row[0]) for row in cursor.fetchall()]
+        self._sync_caches()
+        return list(self._cached_currencies())
+
+    def _read_currencies(self) -> list[str]:
+        """Read the currency codes from the database."""
+        with self._reader() as conn:
+            rows = conn.execute("SELECT DISTINCT code FROM currencies ORDER BY code")
+            return [str(code) for (code,) in rows]
 
     def get_stats(self) -> dict[str, Any]:
         """
@@ -508,38 +661,20 @@ class ExchangeRateStore:
                 "date_range": (None, None),
             }
 
-        cursor = self.conn.cursor()
+        self._sync_caches()
+        return dict(self._cached_stats())
 
-        # Get last update date
-        cursor.execute("SELECT value FROM metadata WHERE key = 'last_updated'")
-        last_updated = cursor.fetchone()
-
-        # Count currencies
-        cursor.execute("SELECT COUNT(DISTINCT code) FROM currencies")
-        currency_count_row = cursor.fetchone()
-        currency_count = int(currency_count_row[0]) if currency_count_row else 0
-
-        # Count rates
-        cursor.execute("SELECT COUNT(*) FROM rates")
-        rate_count_row = cursor.fetchone()
-        rate_count = int(rate_count_row[0]) if rate_count_row else 0
-
-        # Get date range
-        cursor.execute("SELECT MIN(date), MAX(date) FROM rates")
-        date_range_row = cursor.fetchone()
-        date_range: tuple[str | None, str | None] = (
-            (
-                str(date_range_row[0]) if date_range_row[0] is not None else None,
-                str(date_range_row[1]) if date_range_row[1] is not None else None,
+    def _read_stats(self) -> dict[str, Any]:
+        """Read the statistics of an initialized database."""
+        with self._reader() as conn:
+            last_updated, currency_count, rate_count, first_date, last_date = (
+                conn.execute(_STATS_SQL).fetchone()
             )
-            if date_range_row
-            else (None, None)
-        )
 
         return {
             "initialized": True,
-            "last_updated": str(last_updated[0]) if last_updated else None,
+            "last_updated": last_updated,
             "currency_count": currency_count,
             "rate_count": rate_count,
-            "date_range": date_range,
+            "date_range": (first_date, last_date),
         }
@@ -1,38 +1,44 @@
 """Common utilities for ECB exchange rate operations."""
 
 import xml.etree.ElementTree as ET
+from collections.abc import Generator
 from datetime import datetime, timedelta
+from io import BytesIO
+from typing import IO
 
-import requests
 from rich.console import Console
 
-from .constants import ECB_NAMESPACE
+from .constants import ECB_CUBE_TAG
 
 console = Console()
 
+# Days to step back from each weekday (Monday=0) to the last business day
+_BUSINESS_DAY_OFFSETS = tuple(timedelta(days=days) for days in (0, 0, 0, 0, 0, 1, 2))
+
 
 def get_last_business_day(date_obj: datetime) -> datetime:
     """
     Gets the last business day (Monday to Friday) before or on the given date.
     """
-    if date_obj.weekday() < 5:
-        return date_obj
-    if date_obj.weekday() == 5:  # Saturday
-        return date_obj - timedelta(days=1)
-    # Sunday
-    return date_obj - timedelta(days=2)
+    return date_obj - _BUSINESS_DAY_OFFSETS[date_obj.weekday()]
+
+
+def fetch_ecb_data(url: str) -> IO[bytes] | None:
+    """
+    Fetches the ECB's XML data.
+
+    The feed is returned as a binary stream backed by the on-disk HTTP cache.
+    """
+    # requests is only needed when the feed is actually downloaded.
+    import requests  # noqa: PLC0415
 
+    from .http import cached_get  # noqa: PLC0415
 
-def fetch_ecb_data(url: str) -> bytes | None:
-    """Fetches the ECB's XML data."""
     try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
+        return cached_get(url, timeout=30)
     except requests.exceptions.RequestException as e:
         console.print(f"[bold red]Error fetching data: {e}[/bold red]")
         return None
-    else:
-        return response.content
 
 
 def parse_ecb_xml(xml_data: bytes | str) -> ET.Element | None:
@@ -44,15 +50,43 @@ def parse_ecb_xml(xml_data: bytes | str) -> ET.Element | None:
         return None
 
 
+def iter_ecb_rates(xml_data: bytes | IO[bytes]) -> Generator[tuple[str, str, str]]:
+    """
+    Yields (date, currency, rate) tuples from the ECB's XML data.
+
+    The feed is streamed with a single iterparse pass; each daily cube is
+    read once its closing tag is seen and then cleared. Malformed XML raises
+    `ET.ParseError` from the point where it is encountered. A stream passed
+    in is closed once the generator is exhausted or closed.
+    """
+    source = BytesIO(xml_data) if isinstance(xml_data, bytes) else xml_data
+    with source:
+        for _, elem in ET.iterparse(source, events=("end",)):  # noqa: S314  # data is from the trusted ECB API
+            if elem.tag != ECB_CUBE_TAG:
+                continue
+            date_str = elem.get("time")
+            if date_str is None:
+                continue
+            for child in elem:
+                currency = child.get("currency")
+                rate = child.get("rate")
+                if currency is not None and rate is not None:
+                    yield (date_str, currency, rate)
+            elem.clear()
+
+
 def get_available_dates(root: ET.Element) -> list[str]:
-    """Gets the available dates from the parsed XML."""
-    available_dates: list[str] = []
-    for cube in root.findall(".//ns:Cube[@time]", ECB_NAMESPACE):
-        time_val = cube.attrib.get("time")
-        if time_val is not None:
-            available_dates.append(time_val)
-    available_dates.sort(reverse=True)
-    return available_dates
+    """
+    Gets the available dates from the parsed XML, newest first.
+
+    The ECB feeds already list the days newest first, so the dates are
+    returned in document order without sorting.
+    """
+    return [
+        time_val
+        for cube in root.iter(ECB_CUBE_TAG)
+        if (time_val := cube.get("time")) is not None
+    ]
 
 
 def format_date(date_str: str | None) -> str | None:
@@ -62,19 +96,3 @@ def format_date(date_str: str | None) -> str | None:
     if "-" not in date_str and len(date_str) >= 8:
         return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
     return date_str
-
-
-def parse_date(date_str: str | None) -> datetime | None:
-    """Parses a date string to a datetime object."""
-    if not date_str:
-        return None
-    try:
-        formatted = format_date(date_str)
-        if formatted is None:
-            return None
-        return datetime.strptime(formatted, "%Y-%m-%d")
-    except ValueError:
-        console.print(
-            f"[bold red]Error: Invalid date format: {date_str}. Use YYYY-MM-DD[/bold red]"
-        )
-        return None
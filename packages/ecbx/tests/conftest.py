@@ -1 +1,19 @@
 """Pytest configuration and shared fixtures."""
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_http_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Keep the HTTP cache of every test inside its own temporary directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def temp_db(tmp_path: Path) -> str:
+    """Create an empty database file inside the test's temporary directory."""
+    db_path = tmp_path / "test.db"
+    db_path.touch()
+    return str(db_path)
@@ -1,15 +1,13 @@
 """Tests for CLI commands."""
 
 import json
-import tempfile
-from collections.abc import Generator
+from pathlib import Path
 from typing import Any
 from unittest.mock import patch
 
 import pytest
 from click.testing import CliRunner
 from ecbx.cli import cli
-from ecbx.utils import parse_ecb_xml
 
 
 @pytest.fixture
@@ -18,14 +16,7 @@ def runner() -> CliRunner:
     return CliRunner()
 
 
-@pytest.fixture
-def temp_db() -> Generator[str]:
-    """Create a temporary database file."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        yield f.name
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_xml_data() -> bytes:
     """Sample ECB XML data for testing."""
     return b"""<?xml version="1.0" encoding="UTF-8"?>
@@ -41,6 +32,18 @@ def sample_xml_data() -> bytes:
     </gesmes:Envelope>"""
 
 
+@pytest.fixture(scope="session")
+def initialized_db(
+    tmp_path_factory: pytest.TempPathFactory, sample_xml_data: bytes
+) -> str:
+    """Initialize one database shared by the tests that only read from it."""
+    db_path = str(tmp_path_factory.mktemp("db") / "rates.db")
+    with patch("ecbx.store.fetch_ecb_data", return_value=sample_xml_data):
+        result = CliRunner().invoke(cli, ["--db", db_path, "initialize"])
+    assert result.exit_code == 0
+    return db_path
+
+
 class TestCLI:
     """Test CLI commands."""
 
@@ -51,10 +54,8 @@ class TestCLI:
         assert "Tool for fetching and querying exchange rates" in result.output
 
     @patch("ecbx.store.fetch_ecb_data")
-    @patch("ecbx.store.parse_ecb_xml")
     def test_initialize_command(
         self,
-        mock_parse: Any,
         mock_fetch: Any,
         runner: CliRunner,
         temp_db: str,
@@ -62,7 +63,6 @@ class TestCLI:
     ) -> None:
         """Test initialize command."""
         mock_fetch.return_value = sample_xml_data
-        mock_parse.return_value = parse_ecb_xml(sample_xml_data)
 
         result = runner.invoke(cli, ["--db", temp_db, "initialize"])
         assert result.exit_code == 0
@@ -74,49 +74,27 @@ class TestCLI:
         assert result.exit_code == 0
         assert "Database not initialized" in result.output
 
-    @patch("ecbx.store.fetch_ecb_data")
-    @patch("ecbx.store.parse_ecb_xml")
     def test_status_initialized(
         self,
-        mock_parse: Any,
-        mock_fetch: Any,
         runner: CliRunner,
-        temp_db: str,
-        sample_xml_data: bytes,
+        initialized_db: str,
     ) -> None:
         """Test status command on initialized database."""
-        mock_fetch.return_value = sample_xml_data
-        mock_parse.return_value = parse_ecb_xml(sample_xml_data)
-
-        # Initialize first
-        runner.invoke(cli, ["--db", temp_db, "initialize"])
-
         # Check status
-        result = runner.invoke(cli, ["--db", temp_db, "status"])
+        result = runner.invoke(cli, ["--db", initialized_db, "status"])
         assert result.exit_code == 0
         assert "Exchange Rate Database Status" in result.output
         assert "Last Updated" in result.output
         assert "Currencies" in result.output
 
-    @patch("ecbx.store.fetch_ecb_data")
-    @patch("ecbx.store.parse_ecb_xml")
     def test_status_verbose(
         self,
-        mock_parse: Any,
-        mock_fetch: Any,
         runner: CliRunner,
-        temp_db: str,
-        sample_xml_data: bytes,
+        initialized_db: str,
     ) -> None:
         """Test status command with verbose flag."""
-        mock_fetch.return_value = sample_xml_data
-        mock_parse.return_value = parse_ecb_xml(sample_xml_data)
-
-        # Initialize first
-        runner.invoke(cli, ["--db", temp_db, "initialize"])
-
         # Check verbose status
-        result = runner.invoke(cli, ["--db", temp_db, "--verbose", "status"])
+        result = runner.invoke(cli, ["--db", initialized_db, "--verbose", "status"])
         assert result.exit_code == 0
         assert "Available Currencies:" in result.output
         assert "USD" in result.output
@@ -125,49 +103,52 @@ class TestCLI:
         reason="optional DATE positional consumes the first required arg; needs --date option redesign",
         strict=True,
     )
-    @patch("ecbx.store.fetch_ecb_data")
-    @patch("ecbx.store.parse_ecb_xml")
     def test_convert_command(
         self,
-        mock_parse: Any,
-        mock_fetch: Any,
         runner: CliRunner,
-        temp_db: str,
-        sample_xml_data: bytes,
+        initialized_db: str,
     ) -> None:
         """Test convert command."""
-        mock_fetch.return_value = sample_xml_data
-        mock_parse.return_value = parse_ecb_xml(sample_xml_data)
-
-        # Initialize first
-        runner.invoke(cli, ["--db", temp_db, "initialize"])
-
         # Test conversion
-        result = runner.invoke(cli, ["--db", temp_db, "convert", "EUR", "USD", "100"])
+        result = runner.invoke(
+            cli, ["--db", initialized_db, "convert", "EUR", "USD", "100"]
+        )
         assert result.exit_code == 0
         assert "ECB Exchange Rate" in result.output
         assert "100.00 EUR" in result.output
 
-    @patch("ecbx.store.fetch_ecb_data")
-    @patch("ecbx.store.parse_ecb_xml")
+    def test_convert_exact(
+        self,
+        runner: CliRunner,
+        initialized_db: str,
+    ) -> None:
+        """Test convert command with decimal arithmetic."""
+        # Test conversion
+        result = runner.invoke(
+            cli,
+            [
+                "--db",
+                initialized_db,
+                "convert",
+                "--exact",
+                "2024-01-05",
+                "EUR",
+                "USD",
+                "100",
+            ],
+        )
+        assert result.exit_code == 0
+        assert "100.00 EUR = 109.55 USD" in result.output
+
     def test_convert_with_date(
         self,
-        mock_parse: Any,
-        mock_fetch: Any,
         runner: CliRunner,
-        temp_db: str,
-        sample_xml_data: bytes,
+        initialized_db: str,
     ) -> None:
         """Test convert command with specific date."""
-        mock_fetch.return_value = sample_xml_data
-        mock_parse.return_value = parse_ecb_xml(sample_xml_data)
-
-        # Initialize first
-        runner.invoke(cli, ["--db", temp_db, "initialize"])
-
         # Test conversion with date
         result = runner.invoke(
-            cli, ["--db", temp_db, "convert", "2024-01-05", "EUR", "USD"]
+            cli, ["--db", initialized_db, "convert", "2024-01-05", "EUR", "USD"]
         )
         assert result.exit_code == 0
         assert "2024-01-05" in result.output
@@ -182,103 +163,83 @@ class TestCLI:
         assert result.exit_code == 0
         assert "Database not initialized" in result.output
 
-    @patch("ecbx.store.fetch_ecb_data")
-    @patch("ecbx.store.parse_ecb_xml")
     def test_currencies_command(
         self,
-        mock_parse: Any,
-        mock_fetch: Any,
         runner: CliRunner,
-        temp_db: str,
-        sample_xml_data: bytes,
+        initialized_db: str,
     ) -> None:
         """Test currencies command."""
-        mock_fetch.return_value = sample_xml_data
-        mock_parse.return_value = parse_ecb_xml(sample_xml_data)
-
-        # Initialize first
-        runner.invoke(cli, ["--db", temp_db, "initialize"])
-
         # List currencies
-        result = runner.invoke(cli, ["--db", temp_db, "currencies"])
+        result = runner.invoke(cli, ["--db", initialized_db, "currencies"])
         assert result.exit_code == 0
         assert "Code" in result.output
         assert "USD" in result.output
         assert "EUR" in result.output
 
-    @patch("ecbx.store.fetch_ecb_data")
-    @patch("ecbx.store.parse_ecb_xml")
     def test_rates_command(
         self,
-        mock_parse: Any,
-        mock_fetch: Any,
         runner: CliRunner,
-        temp_db: str,
-        sample_xml_data: bytes,
+        initialized_db: str,
     ) -> None:
         """Test rates command."""
-        mock_fetch.return_value = sample_xml_data
-        mock_parse.return_value = parse_ecb_xml(sample_xml_data)
-
-        # Initialize first
-        runner.invoke(cli, ["--db", temp_db, "initialize"])
-
         # Show rates
-        result = runner.invoke(cli, ["--db", temp_db, "rates"])
+        result = runner.invoke(cli, ["--db", initialized_db, "rates"])
         assert result.exit_code == 0
         assert "Exchange Rates for" in result.output
         assert "USD" in result.output
 
+    def test_rates_uninitialized(self, runner: CliRunner, tmp_path: Path) -> None:
+        """Test rates and matrix on a missing database leave it uncreated."""
+        db_path = tmp_path / "missing.db"
+        for args in (["rates"], ["matrix", "2024-01-05", "USD"]):
+            result = runner.invoke(cli, ["--db", str(db_path), *args])
+            assert result.exit_code == 0
+            assert "Database not initialized" in result.output
+        assert not db_path.exists()
+
     @pytest.mark.xfail(
         reason="optional DATE positional consumes the first required arg; needs --date option redesign",
         strict=True,
     )
-    @patch("ecbx.store.fetch_ecb_data")
-    @patch("ecbx.store.parse_ecb_xml")
     def test_matrix_command_text(
         self,
-        mock_parse: Any,
-        mock_fetch: Any,
         runner: CliRunner,
-        temp_db: str,
-        sample_xml_data: bytes,
+        initialized_db: str,
     ) -> None:
         """Test matrix command with text output."""
-        mock_fetch.return_value = sample_xml_data
-        mock_parse.return_value = parse_ecb_xml(sample_xml_data)
-
-        # Initialize first
-        runner.invoke(cli, ["--db", temp_db, "initialize"])
-
         # Show matrix
-        result = runner.invoke(cli, ["--db", temp_db, "matrix", "EUR"])
+        result = runner.invoke(cli, ["--db", initialized_db, "matrix", "EUR"])
         assert result.exit_code == 0
         assert "Exchange Rates for EUR" in result.output
 
+    def test_matrix_command_derived_base(
+        self,
+        runner: CliRunner,
+        initialized_db: str,
+    ) -> None:
+        """Test matrix command for a base derived from the EUR rates."""
+        # Show matrix
+        result = runner.invoke(
+            cli, ["--db", initialized_db, "matrix", "2024-01-05", "USD"]
+        )
+        assert result.exit_code == 0
+        assert "Exchange Rates for USD" in result.output
+        assert "0.912825" in result.output  # USD -> EUR
+        assert "144.125970" in result.output  # USD -> JPY
+
     @pytest.mark.xfail(
         reason="optional DATE positional consumes the first required arg; needs --date option redesign",
         strict=True,
     )
-    @patch("ecbx.store.fetch_ecb_data")
-    @patch("ecbx.store.parse_ecb_xml")
     def test_matrix_command_json(
         self,
-        mock_parse: Any,
-        mock_fetch: Any,
         runner: CliRunner,
-        temp_db: str,
-        sample_xml_data: bytes,
+        initialized_db: str,
     ) -> None:
         """Test matrix command with JSON output."""
-        mock_fetch.return_value = sample_xml_data
-        mock_parse.return_value = parse_ecb_xml(sample_xml_data)
-
-        # Initialize first
-        runner.invoke(cli, ["--db", temp_db, "initialize"])
-
         # Show matrix as JSON
         result = runner.invoke(
-            cli, ["--db", temp_db, "matrix", "--format", "json", "EUR"]
+            cli, ["--db", initialized_db, "matrix", "--format", "json", "EUR"]
         )
         assert result.exit_code == 0
 
@@ -1,23 +1,15 @@
 """Tests for ExchangeRateStore class."""
 
-import tempfile
-from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
 from decimal import Decimal
+from io import BytesIO
 from pathlib import Path
 from typing import Any
 from unittest.mock import patch
 
 import pytest
 from ecbx.store import ExchangeRateStore
-from ecbx.utils import parse_ecb_xml
-
-
-@pytest.fixture
-def temp_db() -> Generator[str]:
-    """Create a temporary database file."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        yield f.name
-    # Cleanup happens automatically when file goes out of scope
 
 
 @pytest.fixture
@@ -66,6 +58,35 @@ class TestExchangeRateStore:
         assert store.db_path == mock_path
         store.close()
 
+    @patch("ecbx.store.fetch_ecb_data")
+    def test_in_memory_db(self, mock_fetch: Any, sample_xml_data: bytes) -> None:
+        """Test the store works on an in-memory database."""
+        mock_fetch.return_value = sample_xml_data
+
+        store = ExchangeRateStore(":memory:")
+        store.initialize()
+        assert store.get_rate("EUR", "USD", "2024-01-05") == (
+            "2024-01-05",
+            Decimal("1.0955"),
+        )
+        store.close()
+
+    def test_context_manager_closes(self, temp_db: str) -> None:
+        """Test leaving the with block closes the connection."""
+        with ExchangeRateStore(temp_db) as store:
+            assert store.list_currencies() == []
+            assert store._conn is not None  # noqa: SLF001  # intentional: testing internal state
+        assert store._conn is None  # noqa: SLF001  # intentional: testing internal state
+
+    def test_missing_db_not_created_by_reads(self, tmp_path: Path) -> None:
+        """Test read-only calls do not create a missing database file."""
+        db_path = tmp_path / "missing.db"
+        store = ExchangeRateStore(str(db_path))
+        assert store.list_currencies() == []
+        assert not store.get_stats()["initialized"]
+        assert not db_path.exists()
+        store.close()
+
     def test_check_tables_exist_empty_db(self, temp_db: str) -> None:
         """Test checking tables in empty database."""
         store = ExchangeRateStore(temp_db)
@@ -73,13 +94,11 @@ class TestExchangeRateStore:
         store.close()
 
     @patch("ecbx.store.fetch_ecb_data")
-    @patch("ecbx.store.parse_ecb_xml")
     def test_initialize(
-        self, mock_parse: Any, mock_fetch: Any, temp_db: str, sample_xml_data: bytes
+        self, mock_fetch: Any, temp_db: str, sample_xml_data: bytes
     ) -> None:
         """Test database initialization."""
         mock_fetch.return_value = sample_xml_data
-        mock_parse.return_value = parse_ecb_xml(sample_xml_data)
 
         store = ExchangeRateStore(temp_db)
         rate_count, date_count = store.initialize()
@@ -97,6 +116,23 @@ class TestExchangeRateStore:
 
         store.close()
 
+    @patch("ecbx.store.fetch_ecb_data")
+    def test_update_closes_feed(
+        self, mock_fetch: Any, temp_db: str, sample_xml_data: bytes
+    ) -> None:
+        """Test the fetched feed is closed even when parsing stops early."""
+        mock_fetch.return_value = sample_xml_data
+        store = ExchangeRateStore(temp_db)
+        store.initialize()
+
+        feed = BytesIO(sample_xml_data)
+        mock_fetch.return_value = feed
+        with patch("ecbx.store.get_last_business_day") as mock_day:
+            mock_day.return_value = datetime(2024, 1, 8, tzinfo=UTC)
+            assert store.update()[0] == 0
+        assert feed.closed
+        store.close()
+
     def test_get_rate_uninitialized_db(self, temp_db: str) -> None:
         """Test getting rate from uninitialized database."""
         store = ExchangeRateStore(temp_db)
@@ -106,13 +142,11 @@ class TestExchangeRateStore:
         store.close()
 
     @patch("ecbx.store.fetch_ecb_data")
-    @patch("ecbx.store.parse_ecb_xml")
     def test_get_rate_exact_date(
-        self, mock_parse: Any, mock_fetch: Any, temp_db: str, sample_xml_data: bytes
+        self, mock_fetch: Any, temp_db: str, sample_xml_data: bytes
     ) -> None:
         """Test getting rate for exact date."""
         mock_fetch.return_value = sample_xml_data
-        mock_parse.return_value = parse_ecb_xml(sample_xml_data)
 
         store = ExchangeRateStore(temp_db)
         store.initialize()
@@ -131,13 +165,11 @@ class TestExchangeRateStore:
         store.close()
 
     @patch("ecbx.store.fetch_ecb_data")
-    @patch("ecbx.store.parse_ecb_xml")
     def test_get_rate_latest(
-        self, mock_parse: Any, mock_fetch: Any, temp_db: str, sample_xml_data: bytes
+        self, mock_fetch: Any, temp_db: str, sample_xml_data: bytes
     ) -> None:
         """Test getting latest rate."""
         mock_fetch.return_value = sample_xml_data
-        mock_parse.return_value = parse_ecb_xml(sample_xml_data)
 
         store = ExchangeRateStore(temp_db)
         store.initialize()
@@ -149,13 +181,11 @@ class TestExchangeRateStore:
         store.close()
 
     @patch("ecbx.store.fetch_ecb_data")
-    @patch("ecbx.store.parse_ecb_xml")
     def test_get_rate_closest_before(
-        self, mock_parse: Any, mock_fetch: Any, temp_db: str, sample_xml_data: bytes
+        self, mock_fetch: Any, temp_db: str, sample_xml_data: bytes
     ) -> None:
         """Test getting closest rate before a date."""
         mock_fetch.return_value = sample_xml_data
-        mock_parse.return_value = parse_ecb_xml(sample_xml_data)
 
         store = ExchangeRateStore(temp_db)
         store.initialize()
@@ -168,13 +198,33 @@ class TestExchangeRateStore:
         store.close()
 
     @patch("ecbx.store.fetch_ecb_data")
-    @patch("ecbx.store.parse_ecb_xml")
+    def test_get_rate_closest(
+        self, mock_fetch: Any, temp_db: str, sample_xml_data: bytes
+    ) -> None:
+        """Test getting the nearest rate on either side of a date."""
+        mock_fetch.return_value = sample_xml_data
+
+        store = ExchangeRateStore(temp_db)
+        store.initialize()
+
+        # Before the first date only the following rate exists
+        date, rate = store.get_rate("USD", "JPY", "2024-01-01", closest_rate="closest")
+        assert date == "2024-01-04"
+        assert rate is not None
+        assert abs(rate - Decimal("157.50") / Decimal("1.0950")) < Decimal("0.01")
+
+        # After the last date only the preceding rate exists
+        date, _ = store.get_rate("EUR", "USD", "2024-01-09", closest_rate="closest")
+        assert date == "2024-01-05"
+
+        store.close()
+
+    @patch("ecbx.store.fetch_ecb_data")
     def test_cross_rates(
-        self, mock_parse: Any, mock_fetch: Any, temp_db: str, sample_xml_data: bytes
+        self, mock_fetch: Any, temp_db: str, sample_xml_data: bytes
     ) -> None:
         """Test cross-rate calculations."""
         mock_fetch.return_value = sample_xml_data
-        mock_parse.return_value = parse_ecb_xml(sample_xml_data)
 
         store = ExchangeRateStore(temp_db)
         store.initialize()
@@ -194,13 +244,11 @@ class TestExchangeRateStore:
         store.close()
 
     @patch("ecbx.store.fetch_ecb_data")
-    @patch("ecbx.store.parse_ecb_xml")
     def test_get_stats(
-        self, mock_parse: Any, mock_fetch: Any, temp_db: str, sample_xml_data: bytes
+        self, mock_fetch: Any, temp_db: str, sample_xml_data: bytes
     ) -> None:
         """Test getting database statistics."""
         mock_fetch.return_value = sample_xml_data
-        mock_parse.return_value = parse_ecb_xml(sample_xml_data)
 
         store = ExchangeRateStore(temp_db)
 
@@ -234,6 +282,135 @@ class TestExchangeRateStore:
 
         store.close()
 
+    @patch("ecbx.store.get_last_business_day")
+    @patch("ecbx.store.fetch_ecb_data")
+    def test_update_already_current(
+        self,
+        mock_fetch: Any,
+        mock_business_day: Any,
+        temp_db: str,
+        sample_xml_data: bytes,
+    ) -> None:
+        """Test update skips the download when the latest rates are stored."""
+        mock_fetch.return_value = sample_xml_data
+        mock_business_day.return_value = datetime(2024, 1, 5, tzinfo=UTC)
+
+        store = ExchangeRateStore(temp_db)
+        store.initialize()
+        mock_fetch.reset_mock()
+
+        assert store.update() == (0, None)
+        mock_fetch.assert_not_called()
+
+        store.close()
+
+    @patch("ecbx.store.fetch_ecb_data")
+    def test_update_new_data(
+        self, mock_fetch: Any, temp_db: str, sample_xml_data: bytes
+    ) -> None:
+        """Test update only adds dates newer than the last update."""
+        mock_fetch.return_value = sample_xml_data
+
+        store = ExchangeRateStore(temp_db)
+        store.initialize()
+
+        mock_fetch.return_value = sample_xml_data.replace(
+            b'<Cube time="2024-01-05">',
+            b'<Cube time="2024-01-08"><Cube currency="USD" rate="1.0970"/></Cube>'
+            b'<Cube time="2024-01-05">',
+        )
+        rate_count, latest_date = store.update()
+
+        assert rate_count > 0
+        assert latest_date == "2024-01-08"
+        assert store.get_rate("EUR", "USD", "2024-01-08") == (
+            "2024-01-08",
+            Decimal("1.0970"),
+        )
+        assert store.get_rate("EUR", "USD", "2024-01-05") == (
+            "2024-01-05",
+            Decimal("1.0955"),
+        )
+
+        store.close()
+
+    @patch("ecbx.store.fetch_ecb_data")
+    def test_update_drops_derived_rates(
+        self, mock_fetch: Any, temp_db: str, sample_xml_data: bytes
+    ) -> None:
+        """Test update removes inverse rates stored by older versions."""
+        mock_fetch.return_value = sample_xml_data
+
+        store = ExchangeRateStore(temp_db)
+        store.initialize()
+        rate_count = store.get_stats()["rate_count"]
+        store.conn.execute(
+            "INSERT INTO rates VALUES ('2024-01-05', 'USD', 'EUR', 0.9128)"
+        )
+
+        store.update()
+
+        assert store.get_stats()["rate_count"] == rate_count
+        store.close()
+
+    @patch("ecbx.store.fetch_ecb_data")
+    def test_cached_reads_see_other_connection_writes(
+        self, mock_fetch: Any, temp_db: str, sample_xml_data: bytes
+    ) -> None:
+        """Test memoized reads are refreshed when another store writes."""
+        mock_fetch.return_value = sample_xml_data
+
+        writer = ExchangeRateStore(temp_db)
+        writer.initialize()
+
+        reader = ExchangeRateStore(temp_db)
+        assert reader.get_rate("EUR", "USD", "2024-01-08", "before") == (
+            "2024-01-05",
+            Decimal("1.0955"),
+        )
+        assert reader.get_stats()["last_updated"] == "2024-01-05"
+
+        mock_fetch.return_value = sample_xml_data.replace(
+            b'<Cube time="2024-01-05">',
+            b'<Cube time="2024-01-08"><Cube currency="USD" rate="1.0970"/></Cube>'
+            b'<Cube time="2024-01-05">',
+        )
+        writer.update()
+
+        assert reader.get_rate("EUR", "USD", "2024-01-08", "before") == (
+            "2024-01-08",
+            Decimal("1.0970"),
+        )
+        assert reader.get_stats()["last_updated"] == "2024-01-08"
+
+        reader.close()
+        writer.close()
+
+    @patch("ecbx.store.fetch_ecb_data")
+    def test_concurrent_reads(
+        self, mock_fetch: Any, temp_db: str, sample_xml_data: bytes
+    ) -> None:
+        """Test lookups from several threads share the read-only pool."""
+        mock_fetch.return_value = sample_xml_data
+
+        store = ExchangeRateStore(temp_db)
+        store.initialize()
+
+        def lookup(target: str) -> tuple[str | None, Decimal | None]:
+            return store._lookup_rate("EUR", target, "2024-01-05", None)  # noqa: SLF001  # bypass the memoized get_rate to hit the pool
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lookup, ["USD", "JPY", "GBP"] * 4))
+
+        assert results[:3] == [
+            ("2024-01-05", Decimal("1.0955")),
+            ("2024-01-05", Decimal("157.89")),
+            ("2024-01-05", Decimal("0.8589")),
+        ]
+        assert results[3:] == results[:3] * 3
+
+        store.close()
+
     def test_list_currencies_empty_db(self, temp_db: str) -> None:
         """Test listing currencies from empty database."""
         store = ExchangeRateStore(temp_db)
@@ -1,17 +1,19 @@
 """Tests for utils module."""
 
+import os
 import xml.etree.ElementTree as ET
 from datetime import datetime
 from typing import Any
 from unittest.mock import Mock, patch
 
 import requests
+from ecbx.http import get_cache_dir
 from ecbx.utils import (
     fetch_ecb_data,
     format_date,
     get_available_dates,
     get_last_business_day,
-    parse_date,
+    iter_ecb_rates,
     parse_ecb_xml,
 )
 
@@ -45,19 +47,95 @@ class TestGetLastBusinessDay:
 class TestFetchEcbData:
     """Test fetch_ecb_data function."""
 
-    @patch("ecbx.utils.requests.get")
+    @patch("ecbx.http.SESSION.get")
     def test_successful_fetch(self, mock_get: Any) -> None:
         """Test successful data fetch."""
-        mock_response = Mock()
-        mock_response.content = b"<xml>test data</xml>"
+        mock_response = Mock(status_code=200, headers={})
+        mock_response.iter_content.return_value = [b"<xml>test ", b"data</xml>"]
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        result = fetch_ecb_data("http://test.url")
+        assert result is not None
+        with result:
+            assert result.read() == b"<xml>test data</xml>"
+        mock_get.assert_called_once_with(
+            "http://test.url", timeout=30, stream=True, headers={}
+        )
+
+    @patch("ecbx.http.SESSION.get")
+    def test_cached_fetch(self, mock_get: Any) -> None:
+        """Test that a second fetch within the TTL is served from the cache."""
+        mock_response = Mock(status_code=200, headers={})
+        mock_response.iter_content.return_value = [b"<xml>test ", b"data</xml>"]
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
+        first = fetch_ecb_data("http://test.url")
+        assert first is not None
+        first.close()
+
+        second = fetch_ecb_data("http://test.url")
+        assert second is not None
+        assert second.read() == b"<xml>test data</xml>"
+        second.close()
+        mock_get.assert_called_once()
+
+    @patch("ecbx.http.SESSION.get")
+    def test_expired_fetch_not_modified(self, mock_get: Any) -> None:
+        """Test that an expired cache entry is revalidated and reused on 304."""
+        mock_get.return_value = Mock(status_code=200, headers={"ETag": '"abc"'})
+        mock_get.return_value.iter_content.return_value = [b"<xml>test data</xml>"]
+        first = fetch_ecb_data("http://test.url")
+        assert first is not None
+        first.close()
+
+        # Expire the cached copy
+        for cached in get_cache_dir().iterdir():
+            os.utime(cached, (0, 0))
+
+        mock_get.return_value = Mock(status_code=304)
+        second = fetch_ecb_data("http://test.url")
+        assert second is not None
+        assert second.read() == b"<xml>test data</xml>"
+        second.close()
+        mock_get.assert_called_with(
+            "http://test.url",
+            timeout=30,
+            stream=True,
+            headers={"If-None-Match": '"abc"'},
+        )
+
+    @patch("ecbx.http.SESSION.get")
+    @patch("ecbx.utils.console")
+    def test_interrupted_download(self, mock_console: Any, mock_get: Any) -> None:
+        """Test that a failed download is reported and not cached."""
+        mock_response = Mock(status_code=200, headers={})
+        mock_response.iter_content.side_effect = requests.exceptions.ConnectionError(
+            "Connection broken"
+        )
+        mock_get.return_value = mock_response
+
         result = fetch_ecb_data("http://test.url")
-        assert result == b"<xml>test data</xml>"
+        assert result is None
+        mock_console.print.assert_called_once()
+        assert not list(get_cache_dir().iterdir())
+
+    @patch("ecbx.http.get_cache_dir", side_effect=PermissionError("read-only"))
+    @patch("ecbx.http.SESSION.get")
+    def test_unwritable_cache_fetches_uncached(
+        self, mock_get: Any, mock_cache_dir: Any
+    ) -> None:
+        """Test that an unusable cache directory falls back to a plain fetch."""
+        mock_get.return_value = Mock(status_code=200, content=b"<xml>test data</xml>")
+
+        result = fetch_ecb_data("http://test.url")
+        assert result is not None
+        assert result.read() == b"<xml>test data</xml>"
+        mock_cache_dir.assert_called_once()
         mock_get.assert_called_once_with("http://test.url", timeout=30)
 
-    @patch("ecbx.utils.requests.get")
+    @patch("ecbx.http.SESSION.get")
     @patch("ecbx.utils.console")
     def test_request_exception(self, mock_console: Any, mock_get: Any) -> None:
         """Test handling of request exceptions."""
@@ -67,7 +145,7 @@ class TestFetchEcbData:
         assert result is None
         mock_console.print.assert_called_once()
 
-    @patch("ecbx.utils.requests.get")
+    @patch("ecbx.http.SESSION.get")
     @patch("ecbx.utils.console")
     def test_http_error(self, mock_console: Any, mock_get: Any) -> None:
         """Test handling of HTTP errors."""
@@ -104,6 +182,32 @@ class TestParseEcbXml:
         mock_console.print.assert_called_once()
 
 
+class TestIterEcbRates:
+    """Test iter_ecb_rates function."""
+
+    def test_yields_rate_tuples(self) -> None:
+        """Test streaming (date, currency, rate) tuples in feed order."""
+        xml_data = b"""
+        <gesmes:Envelope xmlns:gesmes="http://www.gesmes.org/xml/2002-08-01"
+                         xmlns="http://www.ecb.int/vocabulary/2002-08-01/eurofxref">
+            <Cube>
+                <Cube time="2024-01-05">
+                    <Cube currency="USD" rate="1.0955"/>
+                    <Cube currency="JPY" rate="157.89"/>
+                </Cube>
+                <Cube time="2024-01-04">
+                    <Cube currency="USD" rate="1.0950"/>
+                </Cube>
+            </Cube>
+        </gesmes:Envelope>
+        """
+        assert list(iter_ecb_rates(xml_data)) == [
+            ("2024-01-05", "USD", "1.0955"),
+            ("2024-01-05", "JPY", "157.89"),
+            ("2024-01-04", "USD", "1.0950"),
+        ]
+
+
 class TestGetAvailableDates:
     """Test get_available_dates function."""
 
@@ -159,39 +263,3 @@ class TestFormatDate:
     def test_short_string(self) -> None:
         """Test string too short to be a date."""
         assert format_date("2024") == "2024"
-
-
-class TestParseDate:
-    """Test parse_date function."""
-
-    def test_valid_date_string(self) -> None:
-        """Test parsing valid date string."""
-        result = parse_date("2024-01-15")
-        assert result == datetime(2024, 1, 15)
-
-    def test_compact_date_format(self) -> None:
-        """Test parsing compact date format."""
-        result = parse_date("20240115")
-        assert result == datetime(2024, 1, 15)
-
-    def test_none_input(self) -> None:
-        """Test None input."""
-        assert parse_date(None) is None
-
-    def test_empty_string(self) -> None:
-        """Test empty string."""
-        assert parse_date("") is None
-
-    @patch("ecbx.utils.console")
-    def test_invalid_date_format(self, mock_console: Any) -> None:
-        """Test invalid date format."""
-        result = parse_date("invalid-date")
-        assert result is None
-        mock_console.print.assert_called_once()
-
-    @patch("ecbx.utils.console")
-    def test_invalid_date_values(self, mock_console: Any) -> None:
-        """Test invalid date values."""
-        result = parse_date("2024-13-45")  # Invalid month and day
-        assert result is None
-        mock_console.print.assert_called_once()
@@ -32,6 +32,8 @@ def get_time_entries(
     }
     url = f"https://api.harvestapp.com/v2/time_entries?from={from_date}&to={to_date}"
     entries = []
+    # Follow Harvest's cursor links one page at a time; fetching numbered
+    # pages concurrently could skip or repeat entries edited mid-export
     while url is not None:
         resp = http_request(
             url,
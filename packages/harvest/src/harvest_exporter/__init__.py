@@ -1,39 +1,49 @@
 #!/usr/bin/env python3
 
 import sys
-from collections import OrderedDict, defaultdict
+from collections import defaultdict
 from dataclasses import dataclass
-from fractions import Fraction
+from decimal import Decimal
 from typing import Any
 
 from transferwise import exchange_rate
 
 
-def convert_currency(
-    amount: Fraction, source_currency: str, target_currency: str
-) -> Fraction:
+def get_exchange_rate(source_currency: str, target_currency: str) -> Decimal:
+    # No need to ask Transferwise for a quote of a currency against itself
+    if source_currency == target_currency:
+        return Decimal(1)
     rate = exchange_rate(source_currency, target_currency)
-    return amount * rate
+    return Decimal(rate.numerator) / rate.denominator
+
+
+def convert_currency(
+    amount: Decimal, source_currency: str, target_currency: str
+) -> Decimal:
+    if source_currency == target_currency:
+        return amount
+    return amount * get_exchange_rate(source_currency, target_currency)
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     name: str = ""
     client: str = ""
-    # Use fractions here to avoid rounding errors, round to cents once on export
-    rounded_hours: Fraction = Fraction(0)
-    cost: Fraction = Fraction(0)
-    hourly_rate: Fraction = Fraction(0)
+    # Use decimals here to avoid binary rounding errors, round to cents once
+    # on export
+    rounded_hours: Decimal = Decimal(0)
+    cost: Decimal = Decimal(0)
+    hourly_rate: Decimal = Decimal(0)
     currency: str = ""
     is_external: bool = False
 
-    def exchange_rate(self, currency: str) -> Fraction:
-        return exchange_rate(self.currency, currency)
+    def exchange_rate(self, currency: str) -> Decimal:
+        return get_exchange_rate(self.currency, currency)
 
-    def converted_cost(self, currency: str) -> Fraction:
+    def converted_cost(self, currency: str) -> Decimal:
         return convert_currency(self.cost, self.currency, currency)
 
-    def converted_hourly_rate(self, currency: str) -> Fraction:
+    def converted_hourly_rate(self, currency: str) -> Decimal:
         return convert_currency(self.hourly_rate, self.currency, currency)
 
     @property
@@ -48,7 +58,7 @@ class Client:
         self.tasks: dict[str, Task] = defaultdict(Task)
 
     def sort(self) -> None:
-        self.tasks = OrderedDict(sorted(self.tasks.items()))
+        self.tasks = dict(sorted(self.tasks.items()))
 
 
 class User:
@@ -56,7 +66,7 @@ class User:
         self.clients: dict[str, Client] = defaultdict(Client)
 
     def sort(self) -> None:
-        self.clients = OrderedDict(sorted(self.clients.items()))
+        self.clients = dict(sorted(self.clients.items()))
         for client in self.clients.values():
             client.sort()
 
@@ -64,8 +74,8 @@ class User:
 def process_entry(
     entry: dict[str, Any],
     users: dict[str, User],
-    hourly_rate: Fraction | None,
-    agency_rate: Fraction | None,
+    hourly_rate: Decimal | None,
+    agency_rate: Decimal | None,
 ) -> None:
     task_name = entry["task"]["name"]
     is_external = (
@@ -82,14 +92,17 @@ def process_entry(
     if hourly_rate is not None:
         rate = hourly_rate
     else:
-        rate = entry["billable_rate"]
-        if rate == 0 or rate is None:
+        billable_rate = entry["billable_rate"]
+        if billable_rate == 0 or billable_rate is None:
             if entry["billable"]:
                 print(
                     f"WARNING, hourly rate for {client_name}/{project_name}/{task_name} is 0.0, skip for export",
                     file=sys.stderr,
                 )
             return
+        # Go through str so the rate keeps the digits Harvest sent instead of
+        # the float's binary expansion
+        rate = Decimal(str(billable_rate))
 
     task = users[entry["user"]["name"]].clients[client_name].tasks[task_name]
     task.name = task_name
@@ -101,7 +114,7 @@ def process_entry(
         assert agency_rate is not None
         # the developer's hourly rate is what we charge to the customer, minus 25%
         task.hourly_rate = rate * agency_rate
-    rounded_hours = Fraction(entry["rounded_hours"])
+    rounded_hours = Decimal(str(entry["rounded_hours"]))
     task.rounded_hours += rounded_hours
     task.is_external = is_external
 
@@ -110,13 +123,13 @@ def process_entry(
     else:
         msg = f"Currency of customer changed from {task.currency} to {entry['client']['currency']} within the billing period. This is not supported!"
         assert task.currency == entry["client"]["currency"], msg
-    task.cost += rounded_hours * Fraction(task.hourly_rate)
+    task.cost += rounded_hours * task.hourly_rate
 
 
 def aggregate_time_entries(
     entries: list[dict[str, Any]],
-    hourly_rate: Fraction | None,
-    agency_rate: Fraction | None,
+    hourly_rate: Decimal | None,
+    agency_rate: Decimal | None,
 ) -> dict[str, User]:
     users: dict[str, User] = defaultdict(User)
     for entry in entries:
@@ -124,4 +137,4 @@ def aggregate_time_entries(
 
     for user in users.values():
         user.sort()
-    return OrderedDict(sorted(users.items()))
+    return dict(sorted(users.items()))
@@ -7,13 +7,25 @@ import os
 import sys
 import urllib.error
 from datetime import date, datetime, timedelta
-from fractions import Fraction
+from decimal import Decimal, InvalidOperation
 
 from harvest import get_current_user, get_time_entries
 
 from . import Task, aggregate_time_entries, export
 
 
+def parse_rate(value: str) -> Decimal:
+    """Parse an hourly rate, rejecting what Decimal accepts but isn't a number."""
+    try:
+        rate = Decimal(value)
+    except InvalidOperation:
+        rate = None
+    if rate is None or not rate.is_finite():
+        msg = f"invalid rate: {value!r}"
+        raise argparse.ArgumentTypeError(msg)
+    return rate
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
@@ -39,7 +51,7 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--hourly-rate",
-        type=Fraction,
+        type=parse_rate,
         help="Use this hourly rate instead of the one from harvest",
     )
     parser.add_argument(
@@ -154,7 +166,7 @@ def exclude_task(task: Task, args: argparse.Namespace) -> bool:
     return task.is_external
 
 
-NUMTIDE_RATE = Fraction(0.75)
+NUMTIDE_RATE = Decimal("0.75")
 
 
 def main() -> None:
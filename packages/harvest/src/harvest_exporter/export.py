@@ -1,19 +1,73 @@
 import csv
 import json
+import operator
 import sys
-from fractions import Fraction
+from decimal import ROUND_HALF_EVEN, Decimal
 
 from rich.console import Console
 from rich.table import Table
 
-from . import User
-
-
-def round_cents(n: Fraction) -> float:
+from . import Task, User
+
+CENT = Decimal("0.01")
+
+CSV_FIELDNAMES = (
+    "user",
+    "start_date",
+    "end_date",
+    "agency",
+    "client",
+    "task",
+    "rounded_hours",
+    "source_cost",
+    "source_currency",
+    "source_hourly_rate",
+    "target_cost",
+    "target_currency",
+    "target_hourly_rate",
+    "exchange_rate",
+)
+# Pulls a record's values in column order in one C call, without the
+# per-row key checks of csv.DictWriter
+csv_row = operator.itemgetter(*CSV_FIELDNAMES)
+
+
+def round_cents(n: Decimal) -> float:
     """
     Use this method only for displaying currencies to avoid rounding errors
     """
-    return float(round(n, 2))
+    return float(n.quantize(CENT, rounding=ROUND_HALF_EVEN))
+
+
+def task_record(
+    user_name: str,
+    client_name: str,
+    task_name: str,
+    task: Task,
+    *,
+    start_date: int,
+    end_date: int,
+    currency: str,
+) -> dict[str, object]:
+    # Look the rate up once per task instead of once per converted amount
+    rate = task.exchange_rate(currency)
+    # Keys are listed in sorted order so the JSON export needs no sort_keys
+    return dict(
+        agency=task.agency,
+        client=client_name,
+        end_date=end_date,
+        exchange_rate=float(rate),
+        rounded_hours=float(task.rounded_hours),
+        source_cost=round_cents(task.cost),
+        source_currency=task.currency,
+        source_hourly_rate=round_cents(task.hourly_rate),
+        start_date=start_date,
+        target_cost=round_cents(task.cost * rate),
+        target_currency=currency,
+        target_hourly_rate=round_cents(task.hourly_rate * rate),
+        task=task_name,
+        user=user_name,
+    )
 
 
 def as_humanreadable(
@@ -28,16 +82,14 @@ def as_humanreadable(
         currencies = {}
         for client_name, client in user.clients.items():
             for task_name, task in client.tasks.items():
+                rate = task.exchange_rate(currency)
                 if task.currency != currency:
-                    currencies[task.currency] = task.exchange_rate(currency)
-                round_cents(task.cost)
-                converted_cost = round_cents(task.converted_cost(currency))
-                converted_hourly_rate = round_cents(
-                    task.converted_hourly_rate(currency)
-                )
+                    currencies[task.currency] = rate
+                converted_cost = round_cents(task.cost * rate)
+                converted_hourly_rate = round_cents(task.hourly_rate * rate)
 
                 print(
-                    f"  {client_name} - {task_name} ({float(round(task.hourly_rate, 2))} {task.currency}/h -> {converted_hourly_rate} {currency}/h): {float(task.rounded_hours)}h -> {converted_cost} {currency}"
+                    f"  {client_name} - {task_name} ({round_cents(task.hourly_rate)} {task.currency}/h -> {converted_hourly_rate} {currency}/h): {float(task.rounded_hours)}h -> {converted_cost} {currency}"
                 )
         print("Exchange rates")
         for source_currency, rate in currencies.items():
@@ -50,48 +102,21 @@ def as_csv(
     end_date: int,
     currency: str,
 ) -> None:
-    fieldnames = [
-        "user",
-        "start_date",
-        "end_date",
-        "agency",
-        "client",
-        "task",
-        "rounded_hours",
-        "source_cost",
-        "source_currency",
-        "source_hourly_rate",
-        "target_cost",
-        "target_currency",
-        "target_hourly_rate",
-        "exchange_rate",
-    ]
-
-    writer = csv.DictWriter(sys.stdout, fieldnames=fieldnames)
-    writer.writeheader()
+    writer = csv.writer(sys.stdout)
+    writer.writerow(CSV_FIELDNAMES)
     for user_name, user in users.items():
         for client_name, client in user.clients.items():
             for task_name, task in client.tasks.items():
-                writer.writerow(
-                    dict(
-                        user=user_name,
-                        start_date=start_date,
-                        end_date=end_date,
-                        agency=task.agency,
-                        client=client_name,
-                        task=task_name,
-                        rounded_hours=float(task.rounded_hours),
-                        source_hourly_rate=round_cents(task.hourly_rate),
-                        source_cost=round_cents(task.cost),
-                        source_currency=task.currency,
-                        target_hourly_rate=round_cents(
-                            task.converted_hourly_rate(currency)
-                        ),
-                        target_cost=round_cents(task.converted_cost(currency)),
-                        target_currency=currency,
-                        exchange_rate=float(task.exchange_rate(currency)),
-                    )
+                record = task_record(
+                    user_name,
+                    client_name,
+                    task_name,
+                    task,
+                    start_date=start_date,
+                    end_date=end_date,
+                    currency=currency,
                 )
+                writer.writerow(csv_row(record))
 
 
 def as_json(
@@ -105,26 +130,17 @@ def as_json(
         for client_name, client in user.clients.items():
             for task_name, task in client.tasks.items():
                 data.append(
-                    dict(
-                        user=user_name,
+                    task_record(
+                        user_name,
+                        client_name,
+                        task_name,
+                        task,
                         start_date=start_date,
                         end_date=end_date,
-                        agency=task.agency,
-                        client=client_name,
-                        task=task_name,
-                        rounded_hours=float(task.rounded_hours),
-                        source_hourly_rate=round_cents(task.hourly_rate),
-                        source_cost=round_cents(task.cost),
-                        source_currency=task.currency,
-                        target_hourly_rate=round_cents(
-                            task.converted_hourly_rate(currency)
-                        ),
-                        target_cost=round_cents(task.converted_cost(currency)),
-                        target_currency=currency,
-                        exchange_rate=float(task.exchange_rate(currency)),
+                        currency=currency,
                     )
                 )
-    json.dump(data, sys.stdout, indent=4, sort_keys=True)
+    json.dump(data, sys.stdout, indent=4)
 
 
 def as_rich_table(
@@ -154,8 +170,9 @@ def as_rich_table(
     for user_name, user in users.items():
         for client_name, client in user.clients.items():
             for task_name, task in client.tasks.items():
+                rate = task.exchange_rate(currency)
                 source_cost = round_cents(task.cost)
-                target_cost = round_cents(task.converted_cost(currency))
+                target_cost = round_cents(task.cost * rate)
                 task_hours = float(task.rounded_hours)
 
                 total_source_cost += source_cost
@@ -170,8 +187,8 @@ def as_rich_table(
                     f"{source_cost:.2f} {task.currency}",
                     f"{round_cents(task.hourly_rate):.2f} {task.currency}/hr",
                     f"{target_cost:.2f} {currency}",
-                    f"{round_cents(task.converted_hourly_rate(currency)):.2f} {currency}/hr",
-                    f"1 {task.currency} = {round_cents(task.exchange_rate(currency)):.2f} {currency}",
+                    f"{round_cents(task.hourly_rate * rate):.2f} {currency}/hr",
+                    f"1 {task.currency} = {round_cents(rate):.2f} {currency}",
                 )
 
     # Add a separator
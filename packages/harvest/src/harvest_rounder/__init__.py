@@ -4,62 +4,62 @@ from dataclasses import dataclass
 from fractions import Fraction
 from typing import Any
 
+import harvest
 from rest import http_request
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeEntry:
-    """Represents a Harvest time entry with rounding information."""
+    """Represents a Harvest time entry with rounding information.
+
+    Durations are whole seconds, so comparing and summing them is plain
+    integer arithmetic.
+    """
 
     id: int
     date: str
-    hours: Fraction
-    rounded_hours: Fraction
+    seconds: int
+    rounded_seconds: int
     notes: str
     project: str
     task: str
     client: str
     user: str
 
+    @property
+    def hours(self) -> Fraction:
+        """Return the original duration in hours."""
+        return Fraction(self.seconds, 3600)
+
+    @property
+    def rounded_hours(self) -> Fraction:
+        """Return the rounded duration in hours."""
+        return Fraction(self.rounded_seconds, 3600)
+
     @property
     def needs_rounding(self) -> bool:
         """Check if this entry needs to be rounded."""
-        return self.hours != self.rounded_hours
+        return self.seconds != self.rounded_seconds
 
     @property
     def difference(self) -> Fraction:
         """Return the difference between rounded and original hours."""
-        return self.rounded_hours - self.hours
+        return Fraction(self.rounded_seconds - self.seconds, 3600)
 
 
-def round_to_increment(hours: Fraction, increment_minutes: int = 15) -> Fraction:
-    """Round hours up to the next increment.
+def round_to_increment(seconds: int, increment_minutes: int = 15) -> int:
+    """Round a duration up to the next increment.
 
     Args:
-        hours: The number of hours as a Fraction
+        seconds: The duration in whole seconds
         increment_minutes: The increment in minutes (default: 15)
 
     Returns:
-        Hours rounded up to the next increment as a Fraction
+        The duration rounded up to the next increment, in seconds
     """
-    # Convert increment from minutes to hours as a fraction
-    increment_hours = Fraction(increment_minutes, 60)
-
-    # If hours is zero, return zero
-    if hours == 0:
-        return Fraction(0)
-
-    # Calculate how many increments fit into the hours
-    # We use ceiling division to round up
-    increments = hours / increment_hours
-
-    # If it's already an exact multiple, return as-is
-    if increments.denominator == 1:
-        return hours
-
-    # Otherwise, round up to next increment
-    rounded_increments = int(increments) + 1
-    return increment_hours * rounded_increments
+    step = increment_minutes * 60
+    # Ceiling division; exact multiples (including zero) are returned as-is
+    return -(-seconds // step) * step
 
 
 def parse_time_entry(entry: dict[str, Any], increment_minutes: int = 15) -> TimeEntry:
@@ -72,14 +72,15 @@ def parse_time_entry(entry: dict[str, Any], increment_minutes: int = 15) -> Time
     Returns:
         A TimeEntry object with original and rounded hours
     """
-    hours = Fraction(entry["hours"]).limit_denominator(1000)
-    rounded_hours = round_to_increment(hours, increment_minutes)
+    # Harvest sends hours as floats; snapping them to whole seconds avoids
+    # float noise without a limit_denominator search
+    seconds = round(entry["hours"] * 3600)
 
     return TimeEntry(
         id=entry["id"],
         date=entry["spent_date"],
-        hours=hours,
-        rounded_hours=rounded_hours,
+        seconds=seconds,
+        rounded_seconds=round_to_increment(seconds, increment_minutes),
         notes=entry.get("notes") or "",
         project=entry["project"]["name"],
         task=entry["task"]["name"],
@@ -107,19 +108,12 @@ def get_time_entries(
     Returns:
         List of TimeEntry objects
     """
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Harvest-Account-id": account_id,
-    }
-    url = f"https://api.harvestapp.com/v2/time_entries?from={from_date}&to={to_date}"
-    entries: list[TimeEntry] = []
-    while url is not None:
-        resp = http_request(url, headers=headers)
-        entries.extend(
-            parse_time_entry(entry, increment_minutes) for entry in resp["time_entries"]
+    return [
+        parse_time_entry(entry, increment_minutes)
+        for entry in harvest.get_time_entries(
+            account_id, access_token, from_date, to_date
         )
-        url = resp["links"]["next"]
-    return entries
+    ]
 
 
 def update_time_entry(
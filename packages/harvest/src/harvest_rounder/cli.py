@@ -1,16 +1,86 @@
 """CLI for rounding Harvest time entries."""
 
 import argparse
+import contextlib
+import hashlib
+import json
 import os
 import sys
+import threading
+import time
 import urllib.error
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from fractions import Fraction
+from pathlib import Path
 
 from harvest import get_current_user
 
 from . import TimeEntry, get_time_entries, update_time_entry
 
+# Time entries updated concurrently when applying changes
+MAX_WORKERS = 8
+
+# The authenticated user's name practically never changes
+USER_CACHE_TTL = 30 * 24 * 60 * 60
+
+# Harvest allows 100 requests per 15 seconds; a few are left for the
+# requests made while fetching the entries
+RATE_LIMIT_REQUESTS = 95
+RATE_LIMIT_PERIOD = 15.0
+
+
+class RateLimiter:
+    """Sliding window rate limit shared by the threads sending requests.
+
+    At most `requests` requests start within any `period` seconds; a request
+    beyond that waits until the oldest one in the window has aged out.
+    """
+
+    def __init__(self, requests: int, period: float) -> None:
+        self.period = period
+        self.starts: deque[float] = deque(maxlen=requests)
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Wait until another request may be sent."""
+        with self.lock:
+            now = time.monotonic()
+            start = now
+            if len(self.starts) == self.starts.maxlen:
+                start = max(now, self.starts[0] + self.period)
+            # The start time is reserved now, so waiting threads are served
+            # in order and the sleep happens outside the lock
+            self.starts.append(start)
+        if start > now:
+            time.sleep(start - now)
+
+
+def cached_current_user(
+    account_id: str, access_token: str, refresh: bool = False
+) -> str:
+    """Get the authenticated user's name, cached in XDG_CACHE_HOME for 30 days.
+
+    The cache file is keyed by a hash of the credentials, so switching tokens
+    looks the user up again. With refresh, the cached name is ignored and
+    replaced.
+    """
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    cache_base = Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+    key = hashlib.sha256(f"{account_id}|{access_token}".encode()).hexdigest()
+    cache_path = cache_base / "harvest-rounder" / f"{key}.json"
+
+    with contextlib.suppress(OSError, ValueError, KeyError):
+        if not refresh and time.time() - cache_path.stat().st_mtime < USER_CACHE_TTL:
+            with cache_path.open() as f:
+                return str(json.load(f)["user"])
+
+    user = get_current_user(account_id, access_token)
+    with contextlib.suppress(OSError):
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps({"user": user}))
+    return user
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -115,9 +185,9 @@ def parse_args() -> argparse.Namespace:
     return args
 
 
-def format_hours(hours: Fraction) -> str:
-    """Format hours as HH:MM."""
-    total_minutes = int(hours * 60)
+def format_hours(seconds: int) -> str:
+    """Format a duration in seconds as HH:MM."""
+    total_minutes = seconds // 60
     h = total_minutes // 60
     m = total_minutes % 60
     return f"{h}:{m:02d}"
@@ -132,11 +202,11 @@ def print_entry(entry: TimeEntry, show_diff: bool = True) -> None:
     """Print a time entry."""
     diff_str = ""
     if show_diff and entry.needs_rounding:
-        diff_minutes = int(entry.difference * 60)
+        diff_minutes = (entry.rounded_seconds - entry.seconds) // 60
         diff_str = f" (+{diff_minutes}min)"
 
     print(
-        f"  {entry.date} | {format_hours(entry.hours)} -> {format_hours(entry.rounded_hours)}{diff_str}"
+        f"  {entry.date} | {format_hours(entry.seconds)} -> {format_hours(entry.rounded_seconds)}{diff_str}"
     )
     print(f"           | {entry.client} / {entry.project} / {entry.task}")
     if entry.notes:
@@ -157,7 +227,7 @@ def main() -> None:
         if args.user:
             filter_user = args.user
         else:
-            filter_user = get_current_user(
+            filter_user = cached_current_user(
                 args.harvest_account_id, args.harvest_bearer_token
             )
         print(f"Fetching time entries for {filter_user}...")
@@ -173,7 +243,17 @@ def main() -> None:
 
     # Filter by user unless --all-users is specified
     if filter_user:
-        entries = [e for e in entries if e.user == filter_user]
+        user_entries = [e for e in entries if e.user == filter_user]
+        if not user_entries and not args.user:
+            # The cached name is stale if the user was renamed; look it up
+            # again before giving up
+            current_user = cached_current_user(
+                args.harvest_account_id, args.harvest_bearer_token, refresh=True
+            )
+            if current_user != filter_user:
+                filter_user = current_user
+                user_entries = [e for e in entries if e.user == filter_user]
+        entries = user_entries
         if not entries:
             print(f"No entries found for user: {filter_user}", file=sys.stderr)
             sys.exit(1)
@@ -185,20 +265,18 @@ def main() -> None:
         print("All entries are already rounded. Nothing to do.")
         return
 
-    # Calculate totals
-    total_original = sum((e.hours for e in to_round), Fraction(0))
-    total_rounded = sum((e.rounded_hours for e in to_round), Fraction(0))
+    # Calculate totals and group by user for display in a single pass
+    total_original = 0
+    total_rounded = 0
+    by_user: dict[str, list[TimeEntry]] = {}
+    for entry in to_round:
+        total_original += entry.seconds
+        total_rounded += entry.rounded_seconds
+        by_user.setdefault(entry.user, []).append(entry)
     total_added = total_rounded - total_original
 
     print(f"\nFound {len(to_round)} entries that need rounding:\n")
 
-    # Group by user for display
-    by_user: dict[str, list[TimeEntry]] = {}
-    for entry in to_round:
-        if entry.user not in by_user:
-            by_user[entry.user] = []
-        by_user[entry.user].append(entry)
-
     for user, user_entries in sorted(by_user.items()):
         print(f"User: {user}")
         user_entries.sort(key=lambda e: e.date)
@@ -209,13 +287,13 @@ def main() -> None:
     print("Summary:")
     print(f"  Entries to round: {len(to_round)}")
     print(
-        f"  Original total:   {format_hours(total_original)} ({float(total_original):.2f}h)"
+        f"  Original total:   {format_hours(total_original)} ({total_original / 3600:.2f}h)"
     )
     print(
-        f"  Rounded total:    {format_hours(total_rounded)} ({float(total_rounded):.2f}h)"
+        f"  Rounded total:    {format_hours(total_rounded)} ({total_rounded / 3600:.2f}h)"
     )
     print(
-        f"  Time added:       {format_hours(total_added)} ({float(total_added):.2f}h)"
+        f"  Time added:       {format_hours(total_added)} ({total_added / 3600:.2f}h)"
     )
     print()
 
@@ -235,21 +313,32 @@ def main() -> None:
     success_count = 0
     error_count = 0
 
-    for entry in to_round:
-        try:
-            update_time_entry(
-                args.harvest_account_id,
-                args.harvest_bearer_token,
-                entry.id,
-                entry.rounded_hours,
-            )
-            success_count += 1
-            print(
-                f"  Updated entry {entry.id}: {format_hours(entry.hours)} -> {format_hours(entry.rounded_hours)}"
-            )
-        except urllib.error.URLError as e:
-            error_count += 1
-            print(f"  Error updating entry {entry.id}: {e}", file=sys.stderr)
+    # Updates are independent, so send them concurrently; results are still
+    # reported in entry order. The shared limiter keeps the requests within
+    # Harvest's rate limit.
+    limiter = RateLimiter(RATE_LIMIT_REQUESTS, RATE_LIMIT_PERIOD)
+
+    def apply(entry: TimeEntry) -> None:
+        limiter.acquire()
+        update_time_entry(
+            args.harvest_account_id,
+            args.harvest_bearer_token,
+            entry.id,
+            entry.rounded_hours,
+        )
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        futures = [pool.submit(apply, entry) for entry in to_round]
+        for entry, future in zip(to_round, futures, strict=True):
+            try:
+                future.result()
+                success_count += 1
+                print(
+                    f"  Updated entry {entry.id}: {format_hours(entry.seconds)} -> {format_hours(entry.rounded_seconds)}"
+                )
+            except urllib.error.URLError as e:
+                error_count += 1
+                print(f"  Error updating entry {entry.id}: {e}", file=sys.stderr)
 
     print(f"\nDone. Updated {success_count} entries, {error_count} errors.")
 
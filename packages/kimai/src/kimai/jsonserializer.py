@@ -15,6 +15,20 @@ class JsonEncoder(json.JSONEncoder):
         raise TypeError(msg)
 
 
+# Field names and Fraction-typed field names per dataclass, filled on first use
+_schemas: dict[type, tuple[frozenset[str], frozenset[str]]] = {}
+
+
+def _schema(cls: type) -> tuple[frozenset[str], frozenset[str]]:
+    """Return a dataclass's field names and those typed as Fraction."""
+    schema = _schemas.get(cls)
+    if schema is None:
+        names = frozenset(f.name for f in fields(cls))
+        fraction_fields = frozenset(f.name for f in fields(cls) if f.type == Fraction)
+        schema = _schemas[cls] = (names, fraction_fields)
+    return schema
+
+
 class JsonSerializable:
     @classmethod
     def from_json(cls, data: dict[str, Any]) -> Self:
@@ -23,17 +37,13 @@ class JsonSerializable:
             msg = f"{cls.__name__} is not a dataclass"
             raise TypeError(msg)
 
-        # Get the field names and types of the dataclass
-        cls_fields = {f.name: f.type for f in fields(cls)}  # type: ignore[arg-type]
-
         # Filter out any fields in the JSON that are not present in the dataclass
-        filtered_data = {}
-        for k, v in data.items():
-            if k in cls_fields:
-                if cls_fields[k] == Fraction:
-                    filtered_data[k] = Fraction(v)
-                else:
-                    filtered_data[k] = v
+        names, fraction_fields = _schema(cls)
+        filtered_data = {
+            k: Fraction(v) if k in fraction_fields else v
+            for k, v in data.items()
+            if k in names
+        }
 
         # Return an instance of the class using the filtered data
         return cls(**filtered_data)
@@ -1,14 +1,24 @@
 """Paperless-ngx API client."""
 
+import contextlib
+import hashlib
+import http.client
 import json
 import logging
 import mimetypes
+import select
+import shutil
+import socket
+import threading
+import time
 import urllib.error
 import urllib.parse
 import urllib.request
 import uuid
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, TypeVar, cast
+from typing import Any, Self, TypeVar, cast
 
 from paperless_cli.models import (
     BulkEditRequest,
@@ -32,6 +42,38 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Upper bound on requests kept in flight by PaperlessClient.gather
+MAX_WORKERS = 8
+
+# Items requested per page from list endpoints
+PAGE_SIZE = 100
+
+# Buffer size used when streaming documents to or from disk
+CHUNK_SIZE = 1024 * 1024
+
+# Seconds a cached GET response stays fresh, per API resource. Only lookup
+# tables that change rarely are cached: documents carry their OCR'd content,
+# tasks are polled while uploading and mail accounts carry IMAP passwords.
+CACHE_TTLS = {
+    "tags": 3600,
+    "correspondents": 3600,
+    "document_types": 3600,
+    "mail_rules": 3600,
+}
+
+# Cached resources whose entries carry counts of another resource's items,
+# so a write to that resource makes them stale too
+DEPENDENT_CACHES = {
+    "documents": ("tags", "correspondents", "document_types"),
+}
+
+# Methods that may safely be resent when an idle keep-alive connection turns
+# out to be closed; POST and PATCH could apply a write twice
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+# Redirects urllib follows, anything else in the 3xx range is an error
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
 # Keys whose values must never reach the debug log (e.g. mail-account IMAP
 # passwords returned by the API, or an auth token echoed back in a payload).
 _SENSITIVE_KEYS = frozenset({"password", "token", "authorization"})
@@ -49,6 +91,47 @@ def _redact(obj: Any) -> Any:
     return obj
 
 
+def _is_dropped(sock: socket.socket) -> bool:
+    """Tell whether the server has closed an idle keep-alive connection.
+
+    An idle connection has nothing to read, so a readable socket means the
+    server closed it (EOF) or sent something unexpected; either way it must
+    not be reused.
+    """
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+def _resource(endpoint: str) -> str:
+    """Return the API resource an endpoint belongs to, e.g. "tags"."""
+    parts = endpoint.strip("/").split("/")
+    return parts[1] if len(parts) > 1 else ""
+
+
+class _StreamedBody:
+    """Request body made of a file framed by a prefix and a suffix.
+
+    The file is read in chunks while sending, and every iteration starts over,
+    so a request retried on a fresh connection sends the whole body again.
+    """
+
+    def __init__(self, prefix: bytes, path: Path, suffix: bytes) -> None:
+        self.prefix = prefix
+        self.path = path
+        self.suffix = suffix
+        self.length = len(prefix) + path.stat().st_size + len(suffix)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.prefix
+        with self.path.open("rb") as f:
+            while chunk := f.read(CHUNK_SIZE):
+                yield chunk
+        yield self.suffix
+
+
 class PaperlessAPIError(Exception):
     """Exception raised for Paperless API errors."""
 
@@ -56,9 +139,10 @@ class PaperlessAPIError(Exception):
 class PaperlessClient:
     """Client for interacting with Paperless-ngx API."""
 
-    def __init__(self, url: str, token: str) -> None:
+    def __init__(self, url: str, token: str, cache_dir: Path | None = None) -> None:
         self.url = url.rstrip("/")
         self.token = token
+        self.cache_dir = cache_dir
 
         # Validate base URL
         parsed = urllib.parse.urlparse(self.url)
@@ -67,6 +151,225 @@ class PaperlessClient:
         )
         assert parsed.netloc, "URL must have a valid netloc"
 
+        # One keep-alive connection per thread, so the pool workers can reuse
+        # theirs across calls instead of paying a TCP/TLS handshake per request.
+        # All of them are tracked so close() can release them.
+        self._local = threading.local()
+        self._connections: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+        # Long-lived workers for gather() and for prefetching the next page in
+        # _paginate(). Prefetches get their own pool: a gathered call that
+        # paginates waits on its prefetch, which must not queue behind it.
+        self._pool: ThreadPoolExecutor | None = None
+        self._prefetch_pool: ThreadPoolExecutor | None = None
+
+        # http.client knows nothing about proxies, so when one is configured
+        # for this server every request goes through urllib instead
+        self._proxied = parsed.scheme in urllib.request.getproxies() and not (
+            urllib.request.proxy_bypass(parsed.hostname or "")
+        )
+
+    def _connection(self) -> http.client.HTTPConnection:
+        """Return this thread's persistent connection to the server."""
+        conn: http.client.HTTPConnection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            parsed = urllib.parse.urlparse(self.url)
+            if parsed.scheme == "https":
+                conn = http.client.HTTPSConnection(parsed.netloc)
+            else:
+                conn = http.client.HTTPConnection(parsed.netloc)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _executor(self, prefetch: bool = False) -> ThreadPoolExecutor:
+        """Return the worker pool, starting it on first use."""
+        with self._lock:
+            if prefetch:
+                if self._prefetch_pool is None:
+                    self._prefetch_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+                return self._prefetch_pool
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+            return self._pool
+
+    def _urlopen(
+        self,
+        method: str,
+        url: str,
+        body: bytes | Iterable[bytes] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> http.client.HTTPResponse:
+        """Send a request with urllib, which handles proxies and redirects."""
+        request = urllib.request.Request(
+            url, data=body, headers=headers or {}, method=method
+        )
+        try:
+            return cast("http.client.HTTPResponse", urllib.request.urlopen(request))
+        except urllib.error.HTTPError as e:
+            # HTTPError is a readable response with a status as well, so the
+            # callers handle it like any other error response
+            return cast("http.client.HTTPResponse", e)
+
+    def _open(
+        self,
+        method: str,
+        url: str,
+        body: bytes | Iterable[bytes] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> http.client.HTTPResponse:
+        """Send a request over the keep-alive connection, return the response.
+
+        The response has to be read to the end before the next request.
+        """
+        if self._proxied:
+            return self._urlopen(method, url, body, headers)
+
+        parsed = urllib.parse.urlparse(url)
+        target = f"{parsed.path}?{parsed.query}" if parsed.query else parsed.path
+        conn = self._connection()
+        if conn.sock is not None and _is_dropped(conn.sock):
+            conn.close()
+        reused = conn.sock is not None
+        try:
+            conn.request(method, target, body=body, headers=headers or {})
+            response = conn.getresponse()
+        except (
+            http.client.RemoteDisconnected,
+            ConnectionResetError,
+            BrokenPipeError,
+        ) as e:
+            conn.close()
+            if not reused:
+                raise
+            if method not in _IDEMPOTENT_METHODS:
+                msg = f"Connection to the server was lost during {method} {url}: {e}"
+                raise PaperlessAPIError(msg) from e
+            # The server dropped the idle connection, retry on a fresh one
+            return self._open(method, url, body, headers)
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            raise
+
+        if 300 <= response.status < 400:
+            return self._redirect(response, method, url, headers or {})
+        return response
+
+    def _redirect(
+        self,
+        response: http.client.HTTPResponse,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+    ) -> http.client.HTTPResponse:
+        """Follow a redirect the way urllib.request would, or reject it.
+
+        GET and HEAD follow any redirect, other methods become a bodyless GET
+        on 301, 302 and 303. Further hops are left to urllib.
+        """
+        # Drain the redirect so the keep-alive connection stays usable
+        response.read()
+        location = response.getheader("Location")
+        follow = response.status in _REDIRECT_STATUSES and (
+            method in {"GET", "HEAD"} or response.status in {301, 302, 303}
+        )
+        if not location or not follow:
+            error_msg = f"HTTP {response.status}: unexpected redirect to {location}"
+            raise PaperlessAPIError(error_msg)
+
+        new_url = urllib.parse.urljoin(url, location)
+        new_method = method if method == "HEAD" else "GET"
+        new_headers = {
+            k: v
+            for k, v in headers.items()
+            if k.lower() not in {"content-type", "content-length"}
+        }
+        logger.debug("HTTP Redirect: %s %s", response.status, new_url)
+        return self._urlopen(new_method, new_url, headers=new_headers)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: bytes | Iterable[bytes] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[int, bytes]:
+        """Send a request over the keep-alive connection, return status and body."""
+        response = self._open(method, url, body, headers)
+        try:
+            return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            self._drop_connection()
+            raise
+
+    def _drop_connection(self) -> None:
+        """Close the calling thread's connection after a failed exchange."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+
+    def close(self) -> None:
+        """Stop the worker pools and close every connection."""
+        with self._lock:
+            pools = [self._pool, self._prefetch_pool]
+            self._pool = self._prefetch_pool = None
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown()
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _cache_path(self, endpoint: str, url: str) -> Path | None:
+        """Return where a GET response is cached, None if it isn't cacheable."""
+        resource = _resource(endpoint)
+        if self.cache_dir is None or resource not in CACHE_TTLS:
+            return None
+        key = hashlib.sha256(f"{self.token}|{url}".encode()).hexdigest()
+        return self.cache_dir / resource / f"{key}.json"
+
+    def _read_cache(self, path: Path, ttl: int) -> dict[str, Any] | None:
+        """Return a cached response body if it is younger than ttl seconds."""
+        try:
+            if time.time() - path.stat().st_mtime >= ttl:
+                return None
+            with path.open() as f:
+                return cast("dict[str, Any]", json.load(f))
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, path: Path, response_body: Any) -> None:
+        """Store a response body, best effort."""
+        with contextlib.suppress(OSError):
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # Write aside and rename so concurrent readers never see half a file
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(response_body))
+            tmp_path.replace(path)
+
+    def _invalidate_cache(self, endpoint: str) -> None:
+        """Drop every cached response of the resource an endpoint writes to.
+
+        Responses of resources counting its items, e.g. the document counts
+        of tags, are dropped as well.
+        """
+        if self.cache_dir is None:
+            return
+        resource = _resource(endpoint)
+        for name in (resource, *DEPENDENT_CACHES.get(resource, ())):
+            for path in (self.cache_dir / name).glob("*.json"):
+                path.unlink(missing_ok=True)
+
     def _request(
         self,
         method: str,
@@ -88,6 +391,17 @@ class PaperlessClient:
             query_string = urllib.parse.urlencode(params)
             url = f"{url}?{query_string}"
 
+        cache_path = None
+        if method == "GET":
+            cache_path = self._cache_path(endpoint, url)
+            if cache_path is not None:
+                cached = self._read_cache(cache_path, CACHE_TTLS[_resource(endpoint)])
+                if cached is not None:
+                    logger.debug("Cache hit: %s %s", method, url)
+                    return cached
+        else:
+            self._invalidate_cache(endpoint)
+
         headers = {
             "Authorization": f"Token {self.token}",
             "Content-Type": "application/json",
@@ -97,44 +411,81 @@ class PaperlessClient:
         if data is not None:
             body = json.dumps(data).encode("utf-8")
 
-        # Log HTTP request
-        logger.debug(f"HTTP Request: {method} {url}")
-        logger.debug(f"Headers: {_redact(headers)}")
-        if data:
-            logger.debug(f"Body: {json.dumps(data, indent=2)}")
-
-        request = urllib.request.Request(url, data=body, headers=headers, method=method)
-
-        try:
-            with urllib.request.urlopen(request) as response:
-                response_body = None
-                if response.status == 204:  # No content
-                    logger.debug(f"HTTP Response: {response.status} No Content")
-                    return {}
-
-                response_text = response.read().decode("utf-8")
-                response_body = json.loads(response_text)
-                logger.debug(f"HTTP Response: {response.status}")
-                logger.debug(
-                    f"Response body: {json.dumps(_redact(response_body), indent=2)}"
+        # Log HTTP request; the pretty-printed dumps are only built when
+        # debug logging is on, as they cost more than parsing the response
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("HTTP Request: %s %s", method, url)
+            logger.debug("Headers: %s", _redact(headers))
+            if data:
+                logger.debug("Body: %s", json.dumps(data, indent=2))
+
+        status, response_data = self._send(method, url, body, headers)
+        if status >= 400:
+            error_body = response_data.decode("utf-8")
+            logger.debug("HTTP Error: %s", status)
+            logger.debug("Error body: %s", error_body)
+            error_msg = f"HTTP {status}: {error_body}"
+            raise PaperlessAPIError(error_msg)
+
+        if status == 204:  # No content
+            logger.debug("HTTP Response: %s No Content", status)
+            return {}
+
+        # json.loads detects the encoding of bytes itself
+        response_body = json.loads(response_data)
+        if debug:
+            logger.debug("HTTP Response: %s", status)
+            logger.debug(
+                "Response body: %s", json.dumps(_redact(response_body), indent=2)
+            )
+        if cache_path is not None:
+            self._write_cache(cache_path, response_body)
+        return cast("dict[str, Any]", response_body)
+
+    def _paginate(
+        self, endpoint: str, params: dict[str, Any] | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Yield the results of every page of a list endpoint.
+
+        The next page is fetched in the background while the current one is
+        consumed.
+        """
+        params = {"page_size": PAGE_SIZE, **(params or {})}
+        response = self._request("GET", endpoint, params=params)
+        while True:
+            next_url = response.get("next")
+            future = None
+            if next_url:
+                # Follow the server's link but keep our own base URL
+                parsed = urllib.parse.urlsplit(next_url)
+                next_params = dict(urllib.parse.parse_qsl(parsed.query))
+                future = self._executor(prefetch=True).submit(
+                    self._request, "GET", parsed.path, params=next_params
                 )
-                return cast("dict[str, Any]", response_body)
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode("utf-8")
-            logger.debug(f"HTTP Error: {e.code}")
-            logger.debug(f"Error body: {error_body}")
-            error_msg = f"HTTP {e.code}: {error_body}"
-            raise PaperlessAPIError(error_msg) from e
+            yield from response["results"]
+            if future is None:
+                return
+            response = future.result()
+
+    def gather(self, *calls: Callable[[], Any]) -> list[Any]:
+        """Run independent API calls concurrently, returning results in order."""
+        if len(calls) <= 1:
+            return [call() for call in calls]
+        pool = self._executor()
+        futures = [pool.submit(call) for call in calls]
+        return [future.result() for future in futures]
 
     def get_mail_accounts(self) -> list[MailAccount]:
         """Get all mail accounts."""
-        response = self._request("GET", "/api/mail_accounts/")
-        return [MailAccount.from_api(account) for account in response["results"]]
+        return [
+            MailAccount.from_api(account)
+            for account in self._paginate("/api/mail_accounts/")
+        ]
 
     def get_mail_rules(self) -> list[MailRule]:
         """Get all mail rules."""
-        response = self._request("GET", "/api/mail_rules/")
-        return [MailRule.from_api(rule) for rule in response["results"]]
+        return [MailRule.from_api(rule) for rule in self._paginate("/api/mail_rules/")]
 
     def get_mail_rule(self, rule_id: int) -> MailRule:
         """Get a specific mail rule."""
@@ -164,8 +515,7 @@ class PaperlessClient:
 
     def get_tags(self) -> list[Tag]:
         """Get all tags."""
-        response = self._request("GET", "/api/tags/")
-        return [Tag.from_api(tag_data) for tag_data in response["results"]]
+        return [Tag.from_api(tag_data) for tag_data in self._paginate("/api/tags/")]
 
     def create_tag(self, tag_request: TagCreateRequest) -> Tag:
         """Create a new tag."""
@@ -179,13 +529,16 @@ class PaperlessClient:
 
     def get_correspondents(self) -> list[Correspondent]:
         """Get all correspondents."""
-        response = self._request("GET", "/api/correspondents/")
-        return [Correspondent.from_api(corr) for corr in response["results"]]
+        return [
+            Correspondent.from_api(corr)
+            for corr in self._paginate("/api/correspondents/")
+        ]
 
     def get_document_types(self) -> list[DocumentType]:
         """Get all document types."""
-        response = self._request("GET", "/api/document_types/")
-        return [DocumentType.from_api(dt) for dt in response["results"]]
+        return [
+            DocumentType.from_api(dt) for dt in self._paginate("/api/document_types/")
+        ]
 
     def search_documents(
         self, search_params: DocumentSearchParams
@@ -205,8 +558,10 @@ class PaperlessClient:
         """Get document metadata."""
         return self._request("GET", f"/api/documents/{document_id}/metadata/")
 
-    def download_document(self, document_id: int, original: bool = False) -> bytes:
-        """Download a document."""
+    def download_document(
+        self, document_id: int, original: bool = False, dest: Path | None = None
+    ) -> bytes | None:
+        """Download a document, streaming it into dest if given."""
         endpoint = f"/api/documents/{document_id}/download/"
         params = {"original": "true"} if original else None
         url = urllib.parse.urljoin(self.url, endpoint)
@@ -214,18 +569,27 @@ class PaperlessClient:
             url = f"{url}?{urllib.parse.urlencode(params)}"
 
         headers = {"Authorization": f"Token {self.token}"}
-        request = urllib.request.Request(url, headers=headers)
-
-        with urllib.request.urlopen(request) as response:
-            return cast("bytes", response.read())
+        response = self._open("GET", url, headers=headers)
+        try:
+            if response.status >= 400:
+                error_body = response.read().decode("utf-8", "replace")
+                error_msg = f"HTTP {response.status}: {error_body}"
+                raise PaperlessAPIError(error_msg)
+            if dest is None:
+                return response.read()
+            # Copy in chunks so large documents never sit in memory whole
+            with dest.open("wb") as f:
+                shutil.copyfileobj(response, f, CHUNK_SIZE)
+        except (OSError, http.client.HTTPException):
+            self._drop_connection()
+            raise
+        return None
 
     def upload_document(
         self, file_path: str, title: str | None = None, tags: list[int] | None = None
     ) -> dict[str, Any]:
         """Upload a document."""
-        # Read file
-        with Path(file_path).open("rb") as f:
-            file_data = f.read()
+        path = Path(file_path)
 
         # Detect MIME type
         mime_type, _ = mimetypes.guess_type(file_path)
@@ -239,52 +603,59 @@ class PaperlessClient:
         # Add file field
         body_parts.append(f"------{boundary}")
         body_parts.append(
-            f'Content-Disposition: form-data; name="document"; filename="{Path(file_path).name}"'
+            f'Content-Disposition: form-data; name="document"; filename="{path.name}"'
         )
         body_parts.append(f"Content-Type: {mime_type}")
         body_parts.append("")
 
-        # Join text parts and add file data
-        text_part = "\r\n".join(body_parts) + "\r\n"
-        body = text_part.encode() + file_data + b"\r\n"
+        # The file data goes between the text parts and is streamed from disk
+        prefix = ("\r\n".join(body_parts) + "\r\n").encode()
+        delimiter = f"------{boundary}\r\n".encode()
+        suffix_parts = [b"\r\n"]
 
         # Add title if provided
         if title:
-            body += f"------{boundary}\r\n".encode()
-            body += b'Content-Disposition: form-data; name="title"\r\n\r\n'
-            body += title.encode() + b"\r\n"
+            suffix_parts += [
+                delimiter,
+                b'Content-Disposition: form-data; name="title"\r\n\r\n',
+                title.encode(),
+                b"\r\n",
+            ]
 
         # Add tags if provided
-        if tags:
-            for tag_id in tags:
-                body += f"------{boundary}\r\n".encode()
-                body += b'Content-Disposition: form-data; name="tags"\r\n\r\n'
-                body += str(tag_id).encode() + b"\r\n"
+        for tag_id in tags or ():
+            suffix_parts += [
+                delimiter,
+                b'Content-Disposition: form-data; name="tags"\r\n\r\n',
+                str(tag_id).encode(),
+                b"\r\n",
+            ]
 
-        body += f"------{boundary}--\r\n".encode()
+        suffix_parts.append(f"------{boundary}--\r\n".encode())
+        body = _StreamedBody(prefix, path, b"".join(suffix_parts))
 
         headers = {
             "Authorization": f"Token {self.token}",
             "Content-Type": f"multipart/form-data; boundary=----{boundary}",
+            "Content-Length": str(body.length),
         }
 
-        url = urllib.parse.urljoin(self.url, "/api/documents/post_document/")
-        request = urllib.request.Request(url, data=body, headers=headers, method="POST")
-
-        try:
-            with urllib.request.urlopen(request) as response:
-                response_text = response.read().decode("utf-8")
-                if response_text:
-                    # The API returns just the task_id as a string
-                    task_id = response_text.strip().strip('"')
-                    return {"task_id": task_id}
-                return {"status": "success"}
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode("utf-8")
-            logger.debug(f"HTTP Error: {e.code}")
-            logger.debug(f"Error body: {error_body}")
-            error_msg = f"HTTP {e.code}: {error_body}"
-            raise PaperlessAPIError(error_msg) from e
+        endpoint = "/api/documents/post_document/"
+        self._invalidate_cache(endpoint)
+        url = urllib.parse.urljoin(self.url, endpoint)
+        status, response_data = self._send("POST", url, body, headers)
+        response_text = response_data.decode("utf-8")
+        if status >= 400:
+            logger.debug("HTTP Error: %s", status)
+            logger.debug("Error body: %s", response_text)
+            error_msg = f"HTTP {status}: {response_text}"
+            raise PaperlessAPIError(error_msg)
+
+        if response_text:
+            # The API returns just the task_id as a string
+            task_id = response_text.strip().strip('"')
+            return {"task_id": task_id}
+        return {"status": "success"}
 
     def delete_document(self, document_id: int) -> None:
         """Delete a document."""
@@ -298,7 +669,11 @@ class PaperlessClient:
         if not tasks:
             return None
 
-        return Task.from_api(tasks[0])
+        task = Task.from_api(tasks[0])
+        # A consumed document only now shows up in the document counts
+        if task.status == "SUCCESS":
+            self._invalidate_cache("/api/documents/")
+        return task
 
     def update_document(
         self, document_id: int, update_request: DocumentUpdateRequest
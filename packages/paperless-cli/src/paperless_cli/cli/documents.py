@@ -1,5 +1,6 @@
 """Document management commands for Paperless-ngx."""
 
+import functools
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -9,6 +10,7 @@ from paperless_cli.cli.formatter import print_table
 from paperless_cli.cli.tags import resolve_tag_names_to_ids
 from paperless_cli.models import (
     BulkEditRequest,
+    Document,
     DocumentSearchParams,
     DocumentUpdateRequest,
 )
@@ -94,11 +96,10 @@ def search_documents(client: PaperlessClient, cmd: DocumentsSearchCommand) -> No
     headers = ["ID", "Title", "Correspondent", "Created", "Tags"]
     rows = []
 
-    # Cache tags and correspondents for efficiency
-    all_tags = client.get_tags()
+    # Fetch the tags and correspondents referenced by the results together,
+    # so names resolve without a request per document
+    all_tags, correspondents = client.gather(client.get_tags, client.get_correspondents)
     tag_dict = {t.id: t.name for t in all_tags}
-
-    correspondents = client.get_correspondents()
     corr_dict = {c.id: c.name for c in correspondents}
 
     for doc in result.results:
@@ -133,9 +134,6 @@ def search_documents(client: PaperlessClient, cmd: DocumentsSearchCommand) -> No
 def get_document(client: PaperlessClient, cmd: DocumentsGetCommand) -> None:
     """Get document details or download it."""
     if cmd.download:
-        # Download the document
-        content = client.download_document(cmd.document_id, cmd.original)
-
         if cmd.output:
             output_path = cmd.output
         else:
@@ -144,8 +142,8 @@ def get_document(client: PaperlessClient, cmd: DocumentsGetCommand) -> None:
             filename = doc.original_file_name or f"document_{cmd.document_id}.pdf"
             output_path = filename
 
-        with Path(output_path).open("wb") as f:
-            f.write(content)
+        # Stream the document straight to disk
+        client.download_document(cmd.document_id, cmd.original, dest=Path(output_path))
         print(f"Downloaded document to: {output_path}")
 
     elif cmd.metadata:
@@ -169,16 +167,21 @@ def get_document(client: PaperlessClient, cmd: DocumentsGetCommand) -> None:
         print(f"Modified: {doc.modified.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"Original filename: {doc.original_file_name or '-'}")
 
+        # Fetch the lookup tables this document needs in one round-trip
+        correspondents, doc_types, tags = client.gather(
+            client.get_correspondents if doc.correspondent else list,
+            client.get_document_types if doc.document_type else list,
+            client.get_tags if doc.tags else list,
+        )
+
         # Correspondent
         if doc.correspondent:
-            correspondents = client.get_correspondents()
             corr = next((c for c in correspondents if c.id == doc.correspondent), None)
             if corr:
                 print(f"Correspondent: {corr.name}")
 
         # Document type
         if doc.document_type:
-            doc_types = client.get_document_types()
             doc_type = next(
                 (dt for dt in doc_types if dt.id == doc.document_type), None
             )
@@ -187,7 +190,6 @@ def get_document(client: PaperlessClient, cmd: DocumentsGetCommand) -> None:
 
         # Tags
         if doc.tags:
-            tags = client.get_tags()
             tag_names = [tag.name for tag in tags if tag.id in doc.tags]
             print(f"Tags: {', '.join(tag_names)}")
 
@@ -294,10 +296,10 @@ def delete_document(client: PaperlessClient, document_id: int, force: bool) -> N
 def update_document(client: PaperlessClient, cmd: DocumentsUpdateCommand) -> None:
     """Update a document's tags."""
     # Get current document to show what we're updating
-    doc = client.get_document(cmd.document_id)
-
-    # Get current tags
-    all_tags = client.get_tags()
+    # and all tags, both in one round-trip
+    doc, all_tags = client.gather(
+        lambda: client.get_document(cmd.document_id), client.get_tags
+    )
     tag_dict = {t.id: t.name for t in all_tags}
     current_tag_names = [tag_dict.get(tag_id, str(tag_id)) for tag_id in doc.tags]
 
@@ -346,13 +348,22 @@ def bulk_edit_documents(client: PaperlessClient, cmd: DocumentsBulkCommand) -> N
     """Perform bulk tag operations on multiple documents."""
     # Validate document IDs exist
     print(f"Validating {len(cmd.document_ids)} documents...")
-    valid_docs = []
-    for doc_id in cmd.document_ids:
+
+    def fetch(doc_id: int) -> Document | None:
         try:
-            doc = client.get_document(doc_id)
-            valid_docs.append(doc)
+            return client.get_document(doc_id)
         except PaperlessAPIError:
+            return None
+
+    docs = client.gather(
+        *(functools.partial(fetch, doc_id) for doc_id in cmd.document_ids)
+    )
+    valid_docs = []
+    for doc_id, doc in zip(cmd.document_ids, docs, strict=True):
+        if doc is None:
             print(f"Warning: Document {doc_id} not found, skipping")
+        else:
+            valid_docs.append(doc)
 
     if not valid_docs:
         print("No valid documents found.")
@@ -157,13 +157,18 @@ def show_mail_rule(client: PaperlessClient, rule_id: int) -> None:
     if rule.assign_correspondent_from:
         print(f"Correspondent From: {rule.assign_correspondent_from}")
 
+    # Fetch the lookup tables this rule needs in one round-trip
+    tags, doc_types, correspondents = client.gather(
+        client.get_tags if rule.assign_tags else list,
+        client.get_document_types if rule.assign_document_type else list,
+        client.get_correspondents if rule.assign_correspondent else list,
+    )
+
     if rule.assign_tags:
-        tags = client.get_tags()
         tag_names = [tag.name for tag in tags if tag.id in rule.assign_tags]
         print(f"Tags: {', '.join(tag_names)}")
 
     if rule.assign_document_type:
-        doc_types = client.get_document_types()
         doc_type = next(
             (dt for dt in doc_types if dt.id == rule.assign_document_type),
             None,
@@ -172,7 +177,6 @@ def show_mail_rule(client: PaperlessClient, rule_id: int) -> None:
             print(f"Document Type: {doc_type.name}")
 
     if rule.assign_correspondent:
-        correspondents = client.get_correspondents()
         correspondent = next(
             (c for c in correspondents if c.id == rule.assign_correspondent),
             None,
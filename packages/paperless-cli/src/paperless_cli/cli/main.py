@@ -85,6 +85,7 @@ class Options:
     token: str | None = None
     token_command: str | None = None
     debug: bool = False
+    no_cache: bool = False
     command: Command | None = None
 
 
@@ -100,6 +101,12 @@ def load_config() -> dict[str, Any]:
     return {}
 
 
+def get_cache_dir() -> Path:
+    """Get the response cache directory under XDG_CACHE_HOME/paperless-cli."""
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME", str(Path.home() / ".cache"))
+    return Path(xdg_cache_home) / "paperless-cli"
+
+
 def get_token(token: str | None, token_command: str | None) -> str | None:
     """Get token from direct value or by running a command."""
     if token:
@@ -140,6 +147,11 @@ def parse_args() -> Options:
         action="store_true",
         help="Enable debug output",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the server instead of reusing cached responses",
+    )
 
     subparsers = parser.add_subparsers(dest="command", help="Commands")
 
@@ -356,6 +368,7 @@ def parse_args() -> Options:
         token=args.token,
         token_command=args.token_command,
         debug=args.debug,
+        no_cache=args.no_cache,
     )
 
     # Create appropriate command object
@@ -509,9 +522,9 @@ def main() -> None:
         )
         sys.exit(1)
 
+    cache_dir = None if options.no_cache else get_cache_dir()
+    client = PaperlessClient(url, token, cache_dir)
     try:
-        client = PaperlessClient(url, token)
-
         # Handle commands using pattern matching
         match options.command:
             case MailAccountsCommand():
@@ -553,6 +566,8 @@ def main() -> None:
     except PaperlessAPIError as e:
         print(f"API Error: {e}")
         sys.exit(1)
+    finally:
+        client.close()
 
 
 if __name__ == "__main__":